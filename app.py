@@ -2,11 +2,10 @@ import streamlit as st
 import pandas as pd
 import asyncio
 import logging
-import sqlite3
+import io
 from datetime import datetime, timedelta
 import os
 from typing import List, Dict, Any
-import plotly.express as px
 import plotly.graph_objects as go
 
 # Configure logging with proper encoding for Windows
@@ -23,6 +22,8 @@ logging.basicConfig(
 from database import DatabaseManager
 from utils import ScrapingUtils
 from scraper.real_business_scraper import RealBusinessScraper
+from scraper.actual_real_scrapers import create_rate_limiter
+from config import RATE_LIMIT
 
 # Page configuration
 st.set_page_config(
@@ -70,17 +71,28 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# IT requirement keywords used for the prospect insight metrics
+IT_REQUIREMENT_PATTERNS = {
+    'website': r'website',
+    'ecommerce': r'e-commerce|online store',
+    'software': r'software|system|CRM|ERP'
+}
+
 # Initialize session state
 if 'db_manager' not in st.session_state:
     st.session_state.db_manager = DatabaseManager()
 
 if 'utils' not in st.session_state:
-    st.session_state.utils = ScrapingUtils()
+    st.session_state.utils = ScrapingUtils(geocode_store=st.session_state.db_manager)
+
+if 'rate_limiter' not in st.session_state:
+    st.session_state.rate_limiter = create_rate_limiter()
 
 if 'scraper' not in st.session_state:
     st.session_state.scraper = RealBusinessScraper(
         st.session_state.utils,
-        st.session_state.db_manager
+        st.session_state.db_manager,
+        rate_limiter=st.session_state.rate_limiter
     )
 
 if 'scraping_results' not in st.session_state:
@@ -89,6 +101,72 @@ if 'scraping_results' not in st.session_state:
 if 'current_businesses' not in st.session_state:
     st.session_state.current_businesses = []
 
+if 'businesses_version' not in st.session_state:
+    st.session_state.businesses_version = 0
+
+@st.cache_data(ttl=60)
+def _cached_stats() -> Dict[str, Any]:
+    """Cached database statistics for the sidebar."""
+    return st.session_state.db_manager.get_statistics()
+
+@st.cache_data(ttl=60)
+def _cached_businesses(location: str = None, category: str = None,
+                       start_date: str = None, end_date: str = None,
+                       search_term: str = None) -> List[Dict[str, Any]]:
+    """Cached business lookup keyed on the primitive filter values."""
+    return st.session_state.db_manager.get_businesses(
+        location=location,
+        category=category,
+        start_date=start_date,
+        end_date=end_date,
+        search_term=search_term
+    )
+
+@st.cache_data
+def _bar_chart(x: tuple, y: tuple, title: str, x_title: str = "", y_title: str = "",
+               colorscale: str = None) -> Dict[str, Any]:
+    """Build a bar chart with graph_objects and cache its serialized form on the data."""
+    marker = dict(color=list(y), colorscale=colorscale, showscale=True) if colorscale else None
+    fig = go.Figure(go.Bar(x=list(x), y=list(y), marker=marker))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title)
+    return fig.to_dict()
+
+@st.cache_data
+def _line_chart(x: tuple, y: tuple, title: str, x_title: str = "", y_title: str = "") -> Dict[str, Any]:
+    """Build a line chart with graph_objects and cache its serialized form on the data."""
+    fig = go.Figure(go.Scatter(x=list(x), y=list(y), mode='lines'))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title)
+    return fig.to_dict()
+
+@st.cache_data
+def _pie_chart(labels: tuple, values: tuple, title: str) -> Dict[str, Any]:
+    """Build a pie chart with graph_objects and cache its serialized form on the data."""
+    fig = go.Figure(go.Pie(labels=list(labels), values=list(values)))
+    fig.update_layout(title=title)
+    return fig.to_dict()
+
+@st.cache_data
+def _to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to CSV once per distinct frame."""
+    return df.to_csv(index=False).encode('utf-8')
+
+def _set_current_businesses(businesses: List[Dict[str, Any]]):
+    """Store the current business list and mark any derived DataFrame stale."""
+    st.session_state.current_businesses = businesses
+    st.session_state.businesses_version += 1
+
+def _get_current_df() -> pd.DataFrame:
+    """Return current_businesses as a DataFrame, rebuilding it only when stale."""
+    if st.session_state.get('current_df_version') != st.session_state.businesses_version:
+        st.session_state.current_df = pd.DataFrame(st.session_state.current_businesses)
+        st.session_state.current_df_version = st.session_state.businesses_version
+    return st.session_state.current_df
+
+def _clear_data_caches():
+    """Invalidate cached database reads after the data changes."""
+    _cached_stats.clear()
+    _cached_businesses.clear()
+
 def main():
     """Main application function."""
     
@@ -100,11 +178,12 @@ def main():
         st.markdown("**Intelligent Business Directory Scraper**")
     with col2:
         if st.button("Refresh Data"):
-            st.rerun()
+            _clear_data_caches()
     st.markdown('</div>', unsafe_allow_html=True)
     
     # Sidebar
-    setup_sidebar()
+    with st.sidebar:
+        setup_sidebar()
     
     # Main content
     tab1, tab2, tab3, tab4 = st.tabs(["Scraper", "Dashboard", "Map View", "Analytics"])
@@ -121,84 +200,92 @@ def main():
     with tab4:
         analytics_interface()
 
+@st.fragment
 def setup_sidebar():
     """Setup sidebar with navigation and controls."""
-    with st.sidebar:
-        st.markdown("## Control Panel")
-        
-        # Quick stats
-        stats = st.session_state.db_manager.get_statistics()
-        st.metric("Total Businesses", stats['total_businesses'])
-        
-        # Recent activity
-        if stats['recent_activity']:
-            st.markdown("### Recent Activity")
-            for activity in stats['recent_activity'][:3]:
-                st.write(f"**{activity['date']}**: {activity['count']} businesses")
-        
-        st.markdown("---")
-        
-        # Export functionality
-        st.markdown("### Export Data")
-        
-        if st.button("Export CSV", key="export_csv_btn"):
-            export_data()
-        
-        if st.button("Clear Data", key="clear_data_btn"):
-            if st.session_state.get('confirm_clear', False):
-                clear_database()
+    st.markdown("## Control Panel")
+    
+    # Quick stats
+    stats = _cached_stats()
+    st.metric("Total Businesses", stats['total_businesses'])
+    
+    # Recent activity
+    if stats['recent_activity']:
+        st.markdown("### Recent Activity")
+        for activity in stats['recent_activity'][:3]:
+            st.write(f"**{activity['date']}**: {activity['count']} businesses")
+    
+    st.markdown("---")
+    
+    # Export functionality
+    st.markdown("### Export Data")
+    
+    if st.button("Export CSV", key="export_csv_btn"):
+        export_data()
+    
+    with st.popover("Clear Data"):
+        st.warning("This will permanently remove all stored businesses!")
+        if st.button("Confirm Clear", key="clear_data_btn"):
+            clear_database()
+    
+    st.markdown("---")
+    
+    # Settings
+    st.markdown("### Settings")
+    
+    # Scraping sources
+    st.markdown("**Scraping Sources (REAL DATA ONLY)**")
+    
+    # Initialize default sources if not set - REAL DATA SOURCES ONLY
+    if 'selected_sources' not in st.session_state:
+        st.session_state.selected_sources = ['justdial', 'googlemaps']  # Removed indiamart and it_clients
+    
+    sources = {
+        'JustDial': st.checkbox('JustDial', value='justdial' in st.session_state.selected_sources, key="source_justdial"),
+        # Removed IndiaMART - no real scraper available
+        'Yellow Pages': st.checkbox('Yellow Pages', value='yellowpages' in st.session_state.selected_sources, key="source_yellowpages"),
+        'Google Maps': st.checkbox('Google Maps', value='googlemaps' in st.session_state.selected_sources, key="source_googlemaps"),
+        # Removed IT Clients - generates demo data
+    }
+    
+    # Update selected sources based on checkboxes
+    st.session_state.selected_sources = []
+    for source, selected in sources.items():
+        if selected:
+            if source == 'Yellow Pages':
+                st.session_state.selected_sources.append('yellowpages')
+            elif source == 'Google Maps':
+                st.session_state.selected_sources.append('googlemaps')
             else:
-                st.session_state.confirm_clear = True
-                st.warning("Click again to confirm clearing all data!")
-                st.rerun()
-        
-        st.markdown("---")
-        
-        # Settings
-        st.markdown("### Settings")
-        
-        # Scraping sources
-        st.markdown("**Scraping Sources (REAL DATA ONLY)**")
-        
-        # Initialize default sources if not set - REAL DATA SOURCES ONLY
-        if 'selected_sources' not in st.session_state:
-            st.session_state.selected_sources = ['justdial', 'googlemaps']  # Removed indiamart and it_clients
-        
-        sources = {
-            'JustDial': st.checkbox('JustDial', value='justdial' in st.session_state.selected_sources, key="source_justdial"),
-            # Removed IndiaMART - no real scraper available
-            'Yellow Pages': st.checkbox('Yellow Pages', value='yellowpages' in st.session_state.selected_sources, key="source_yellowpages"),
-            'Google Maps': st.checkbox('Google Maps', value='googlemaps' in st.session_state.selected_sources, key="source_googlemaps"),
-            # Removed IT Clients - generates demo data
-        }
-        
-        # Update selected sources based on checkboxes
-        st.session_state.selected_sources = []
-        for source, selected in sources.items():
-            if selected:
-                if source == 'Yellow Pages':
-                    st.session_state.selected_sources.append('yellowpages')
-                elif source == 'Google Maps':
-                    st.session_state.selected_sources.append('googlemaps')
-                else:
-                    st.session_state.selected_sources.append(source.lower())  # justdial
-        
-        # Show currently selected sources
-        if st.session_state.selected_sources:
-            st.success(f"Active Sources: {', '.join(st.session_state.selected_sources)}")
-        else:
-            st.warning("No sources selected! Please select at least one source.")
-        
-        
-        # Max results per source
-        st.session_state.max_results = st.slider(
-            "Max Results per Source", 
-            min_value=10, 
-            max_value=200, 
-            value=50, 
-            step=10
-        )
+                st.session_state.selected_sources.append(source.lower())  # justdial
+    
+    # Show currently selected sources
+    if st.session_state.selected_sources:
+        st.success(f"Active Sources: {', '.join(st.session_state.selected_sources)}")
+    else:
+        st.warning("No sources selected! Please select at least one source.")
+    
+    
+    # Max results per source
+    st.session_state.max_results = st.slider(
+        "Max Results per Source", 
+        min_value=10, 
+        max_value=200, 
+        value=50, 
+        step=10
+    )
+    
+    # Shared request rate across all sources
+    requests_per_minute = st.slider(
+        "Max Requests per Minute",
+        min_value=10,
+        max_value=600,
+        value=RATE_LIMIT['requests_per_minute'],
+        step=10
+    )
+    st.session_state.rate_limiter.rate = requests_per_minute / 60
 
+@st.fragment
 def scraper_interface():
     """Interface for scraping operations."""
     st.markdown("## Start Scraping")
@@ -314,13 +401,16 @@ def scraper_interface():
                     )
                 
                 st.session_state.scraping_results = results
-                
-                # Display results
-                display_scraping_results(results, context="new_results")
+                _clear_data_caches()
                 
             except Exception as e:
                 st.error(f" Scraping failed: {str(e)}")
                 logging.error(f"Scraping error: {e}")
+            
+            else:
+                # The data changed: rerun the whole app so the sidebar and every tab refresh;
+                # the results then show below as the last scraping results
+                st.rerun(scope="app")
     
     elif submitted and not location:
         st.error("Please enter a location to scrape!")
@@ -350,6 +440,10 @@ def display_scraping_results(results: Dict[str, Any], context: str = "default"):
             f'</div>',
             unsafe_allow_html=True
         )
+        
+        # Nothing to break down or chart; only the errors are useful here
+        display_scraping_errors(results['errors'])
+        return
     
     # Results breakdown
     col1, col2, col3, col4 = st.columns(4)
@@ -379,21 +473,24 @@ def display_scraping_results(results: Dict[str, Any], context: str = "default"):
             st.dataframe(source_df, use_container_width=True)
         
         with col2:
-            if not source_df.empty:
-                fig = px.bar(
-                    source_df, 
-                    x='Source', 
-                    y='Count',
-                    title="Businesses Found by Source",
-                    color='Count',
-                    color_continuous_scale='Blues'
+            if not source_df.empty and source_df['Count'].sum() > 0:
+                fig = _bar_chart(
+                    tuple(source_df['Source']),
+                    tuple(source_df['Count']),
+                    "Businesses Found by Source",
+                    x_title='Source',
+                    y_title='Count',
+                    colorscale='Blues'
                 )
                 st.plotly_chart(fig, use_container_width=True, key=f"source_chart_{context}")
     
-    # Errors (if any)
-    if results['errors']:
+    display_scraping_errors(results['errors'])
+
+def display_scraping_errors(errors: List[str]):
+    """Display errors encountered during scraping, if any."""
+    if errors:
         st.markdown("### Errors Encountered")
-        for error in results['errors']:
+        for error in errors:
             st.warning(error)
 
 def dashboard_interface():
@@ -421,42 +518,38 @@ def dashboard_interface():
             search_term = st.text_input("🔍 Search Businesses")
     
     # Get filtered data
-    if search_term:
-        businesses = st.session_state.db_manager.search_businesses(search_term)
-    else:
-        start_date = date_range[0].strftime('%Y-%m-%d') if len(date_range) > 0 else None
-        end_date = date_range[1].strftime('%Y-%m-%d') if len(date_range) > 1 else None
-        
-        businesses = st.session_state.db_manager.get_businesses(
-            location=location_filter or None,
-            category=category_filter or None,
-            start_date=start_date,
-            end_date=end_date
-        )
+    start_date = date_range[0].strftime('%Y-%m-%d') if len(date_range) > 0 else None
+    end_date = date_range[1].strftime('%Y-%m-%d') if len(date_range) > 1 else None
+    
+    businesses = _cached_businesses(
+        location=location_filter or None,
+        category=category_filter or None,
+        start_date=start_date,
+        end_date=end_date,
+        search_term=search_term or None
+    )
     
-    st.session_state.current_businesses = businesses
+    _set_current_businesses(businesses)
     
     if businesses:
         # Convert to DataFrame
-        df = pd.DataFrame(businesses)
+        df = _get_current_df()
         
         # Display metrics
+        summary = df.agg({'location': 'nunique', 'contact': 'count', 'website': 'count'})
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
             st.metric(" Total Businesses", len(df))
         
         with col2:
-            unique_locations = df['location'].nunique()
-            st.metric(" Unique Locations", unique_locations)
+            st.metric(" Unique Locations", int(summary['location']))
         
         with col3:
-            with_contact = df['contact'].notna().sum()
-            st.metric(" With Contact Info", with_contact)
+            st.metric(" With Contact Info", int(summary['contact']))
         
         with col4:
-            with_website = df['website'].notna().sum()
-            st.metric("With Websites", with_website)
+            st.metric("With Websites", int(summary['website']))
         
         # Check if we have IT prospect data
         has_it_data = any(col in df.columns for col in ['lead_score', 'pain_points', 'it_requirements'])
@@ -467,35 +560,42 @@ def dashboard_interface():
             # IT-specific metrics
             col1, col2, col3, col4 = st.columns(4)
             
+            if 'it_requirements' in df.columns:
+                requirements = df['it_requirements'].fillna('').astype(str)
+                needs = {
+                    key: int(requirements.str.contains(pattern, case=False, regex=True).sum())
+                    for key, pattern in IT_REQUIREMENT_PATTERNS.items()
+                }
+            else:
+                needs = None
+            
             with col1:
                 if 'lead_score' in df.columns:
                     high_priority = (df['lead_score'] >= 8).sum()
                     st.metric(" High Priority Leads", high_priority)
             
             with col2:
-                if 'it_requirements' in df.columns:
-                    website_needs = df['it_requirements'].str.contains('website', case=False, na=False).sum()
-                    st.metric("Need Websites", website_needs)
+                if needs is not None:
+                    st.metric("Need Websites", needs['website'])
             
             with col3:
-                if 'it_requirements' in df.columns:
-                    ecommerce_needs = df['it_requirements'].str.contains('e-commerce|online store', case=False, na=False).sum()
-                    st.metric("Need E-commerce", ecommerce_needs)
+                if needs is not None:
+                    st.metric("Need E-commerce", needs['ecommerce'])
             
             with col4:
-                if 'it_requirements' in df.columns:
-                    software_needs = df['it_requirements'].str.contains('software|system|CRM|ERP', case=False, na=False).sum()
-                    st.metric("Need Software", software_needs)
+                if needs is not None:
+                    st.metric("Need Software", needs['software'])
             
             # Lead score distribution
             if 'lead_score' in df.columns:
                 st.markdown("#### Lead Score Distribution")
                 score_counts = df['lead_score'].value_counts().sort_index()
-                fig_scores = px.bar(
-                    x=score_counts.index, 
-                    y=score_counts.values,
-                    labels={'x': 'Lead Score', 'y': 'Number of Prospects'},
-                    title="Lead Score Distribution"
+                fig_scores = _bar_chart(
+                    tuple(score_counts.index.tolist()),
+                    tuple(score_counts.tolist()),
+                    "Lead Score Distribution",
+                    x_title='Lead Score',
+                    y_title='Number of Prospects'
                 )
                 st.plotly_chart(fig_scores, use_container_width=True, key=f"score_chart_{hash(str(score_counts))}")
         
@@ -517,7 +617,7 @@ def dashboard_interface():
             )
         
         # Download button
-        csv = df.to_csv(index=False)
+        csv = _to_csv_bytes(df)
         st.download_button(
             label="Download as CSV",
             data=csv,
@@ -536,14 +636,14 @@ def map_interface():
     
     if businesses:
         # Filter businesses with coordinates
-        map_data = [
-            b for b in businesses 
-            if b.get('latitude') and b.get('longitude')
-        ]
+        df = _get_current_df()
+        if {'latitude', 'longitude'}.issubset(df.columns):
+            df_map = df.dropna(subset=['latitude', 'longitude'])
+        else:
+            df_map = df.iloc[0:0]
         
-        if map_data:
+        if not df_map.empty:
             # Create map
-            df_map = pd.DataFrame(map_data)
             
             # Map display
             st.map(
@@ -555,10 +655,10 @@ def map_interface():
             col1, col2 = st.columns(2)
             
             with col1:
-                st.metric("Businesses on Map", len(map_data))
+                st.metric("Businesses on Map", len(df_map))
             
             with col2:
-                coverage = (len(map_data) / len(businesses)) * 100
+                coverage = (len(df_map) / len(businesses)) * 100
                 st.metric("Location Coverage", f"{coverage:.1f}%")
             
             # Detailed map view with folium (if available)
@@ -567,7 +667,7 @@ def map_interface():
                 from streamlit_folium import folium_static
                 
                 if st.checkbox("Show Detailed Map"):
-                    create_folium_map(map_data)
+                    create_folium_map(df_map)
             
             except ImportError:
                 st.info("Install folium and streamlit-folium for enhanced map features")
@@ -578,15 +678,15 @@ def map_interface():
     else:
         st.info("No business data available for mapping.")
 
-def create_folium_map(map_data: List[Dict]):
+def create_folium_map(df_map: pd.DataFrame):
     """Create a detailed Folium map."""
     try:
         import folium
         from streamlit_folium import folium_static
         
         # Calculate center
-        center_lat = sum(b['latitude'] for b in map_data) / len(map_data)
-        center_lon = sum(b['longitude'] for b in map_data) / len(map_data)
+        center_lat = df_map['latitude'].to_numpy(dtype=float).mean()
+        center_lon = df_map['longitude'].to_numpy(dtype=float).mean()
         
         # Create map
         m = folium.Map(
@@ -596,18 +696,27 @@ def create_folium_map(map_data: List[Dict]):
         )
         
         # Add markers
-        for business in map_data:
+        marker_df = df_map.reindex(
+            columns=['latitude', 'longitude', 'business_name', 'address', 'contact', 'category']
+        ).fillna({
+            'business_name': 'Unknown',
+            'address': 'No address',
+            'contact': 'No contact',
+            'category': 'No category'
+        })
+        
+        for lat, lon, name, address, contact, category in marker_df.itertuples(index=False):
             popup_text = f"""
-            <b>{business.get('business_name', 'Unknown')}</b><br>
-            {business.get('address', 'No address')}<br>
-            {business.get('contact', 'No contact')}<br>
-            {business.get('category', 'No category')}
+            <b>{name}</b><br>
+            {address}<br>
+            {contact}<br>
+            {category}
             """
             
             folium.Marker(
-                [business['latitude'], business['longitude']],
+                [lat, lon],
                 popup=folium.Popup(popup_text, max_width=300),
-                tooltip=business.get('business_name', 'Business'),
+                tooltip=name,
                 icon=folium.Icon(color='blue', icon='info-sign')
             ).add_to(m)
         
@@ -624,23 +733,24 @@ def analytics_interface():
     businesses = st.session_state.current_businesses
     
     if businesses:
-        df = pd.DataFrame(businesses)
+        df = _get_current_df()
         
         # Time series analysis
         if 'scraped_at' in df.columns:
-            df['scraped_date'] = pd.to_datetime(df['scraped_at']).dt.date
+            scraped_at = pd.to_datetime(df['scraped_at'], format='ISO8601', cache=True)
             
             col1, col2 = st.columns(2)
             
             with col1:
                 st.markdown("### Scraping Activity Over Time")
-                daily_counts = df.groupby('scraped_date').size().reset_index(name='count')
+                daily_counts = scraped_at.dt.floor('D').value_counts().sort_index()
                 
-                fig = px.line(
-                    daily_counts,
-                    x='scraped_date',
-                    y='count',
-                    title="Businesses Scraped Daily"
+                fig = _line_chart(
+                    tuple(daily_counts.index),
+                    tuple(daily_counts.tolist()),
+                    "Businesses Scraped Daily",
+                    x_title='scraped_date',
+                    y_title='count'
                 )
                 st.plotly_chart(fig, use_container_width=True, key="daily_activity_chart")
             
@@ -648,22 +758,21 @@ def analytics_interface():
                 st.markdown("### 🏷️ Category Distribution")
                 category_counts = df['category'].value_counts().head(10)
                 
-                fig = px.pie(
-                    values=category_counts.values,
-                    names=category_counts.index,
-                    title="Top 10 Categories"
+                fig = _pie_chart(
+                    tuple(category_counts.index.tolist()),
+                    tuple(category_counts.tolist()),
+                    "Top 10 Categories"
                 )
                 st.plotly_chart(fig, use_container_width=True, key="category_pie_chart")
         
         # Location analysis
         st.markdown("### 📍 Location Analysis")
-        location_stats = df.groupby('location').agg({
-            'business_name': 'count',
-            'contact': lambda x: x.notna().sum(),
-            'website': lambda x: x.notna().sum()
-        }).reset_index()
+        location_stats = df.groupby('location').agg(**{
+            'Total Businesses': ('business_name', 'count'),
+            'With Contact': ('contact', 'count'),
+            'With Website': ('website', 'count')
+        }).rename_axis('Location').reset_index()
         
-        location_stats.columns = ['Location', 'Total Businesses', 'With Contact', 'With Website']
         location_stats['Contact %'] = (location_stats['With Contact'] / location_stats['Total Businesses'] * 100).round(1)
         location_stats['Website %'] = (location_stats['With Website'] / location_stats['Total Businesses'] * 100).round(1)
         
@@ -672,20 +781,19 @@ def analytics_interface():
         # Source analysis
         if 'source' in df.columns:
             st.markdown("### 🔍 Source Performance")
-            source_stats = df.groupby('source').agg({
-                'business_name': 'count',
-                'contact': lambda x: x.notna().sum(),
-                'website': lambda x: x.notna().sum()
-            }).reset_index()
+            source_stats = df.groupby('source').agg(**{
+                'Total': ('business_name', 'count'),
+                'With Contact': ('contact', 'count'),
+                'With Website': ('website', 'count')
+            }).rename_axis('Source').reset_index()
             
-            source_stats.columns = ['Source', 'Total', 'With Contact', 'With Website']
-            
-            fig = px.bar(
-                source_stats,
-                x='Source',
-                y='Total',
-                title="Businesses by Source",
-                color='Total'
+            fig = _bar_chart(
+                tuple(source_stats['Source']),
+                tuple(source_stats['Total'].tolist()),
+                "Businesses by Source",
+                x_title='Source',
+                y_title='Total',
+                colorscale='Plasma'
             )
             st.plotly_chart(fig, use_container_width=True, key="source_performance_chart")
     
@@ -698,30 +806,15 @@ def export_data():
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"businesses_export_{timestamp}.csv"
         
-        # Get all businesses from database
-        businesses = st.session_state.db_manager.get_businesses()
+        # Create CSV content in memory, straight from the database cursor
+        buffer = io.StringIO()
+        exported = st.session_state.db_manager.write_csv(buffer)
         
-        if not businesses:
+        if not exported:
             st.error(" No data to export")
             return
         
-        # Create CSV content in memory
-        import csv
-        import io
-        
-        output = io.StringIO()
-        fieldnames = ['business_name', 'contact', 'address', 'website', 
-                     'category', 'location', 'scraped_at', 'source']
-        
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for business in businesses:
-            row = {field: business.get(field, '') for field in fieldnames}
-            writer.writerow(row)
-        
-        csv_data = output.getvalue()
-        output.close()
+        csv_data = buffer.getvalue().encode('utf-8')
         
         # Provide download button
         st.download_button(
@@ -732,7 +825,7 @@ def export_data():
             key="download_csv"
         )
         
-        st.success(f" {len(businesses)} businesses ready for download!")
+        st.success(f" {exported} businesses ready for download!")
     
     except Exception as e:
         st.error(f"❌ Export error: {e}")
@@ -740,29 +833,25 @@ def export_data():
 def clear_database():
     """Clear all data from database."""
     try:
-        # Check if there's any data to clear
-        businesses = st.session_state.db_manager.get_businesses()
-        if not businesses:
+        # Check if there's any data to clear (one row is enough to tell)
+        if not st.session_state.db_manager.get_businesses(limit=1):
             st.info(" Database is already empty!")
             return
         
-        # Clear all data from database
-        with sqlite3.connect(st.session_state.db_manager.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM businesses")
-            cursor.execute("DELETE FROM scraping_sessions")
-            conn.commit()
+        # Clear all data from database in a single transaction
+        removed = st.session_state.db_manager.clear_all_data()
+        
+        _clear_data_caches()
         
         # Clear session state
         if 'current_businesses' in st.session_state:
-            st.session_state.current_businesses = []
+            _set_current_businesses([])
         if 'scraping_results' in st.session_state:
             st.session_state.scraping_results = None
-        if 'confirm_clear' in st.session_state:
-            del st.session_state.confirm_clear
         
-        st.success(f" Database cleared successfully! Removed {len(businesses)} businesses.")
-        st.rerun()
+        st.success(f" Database cleared successfully! Removed {removed} businesses.")
+        # Called from the sidebar fragment; rerun everything so all tabs drop the old data
+        st.rerun(scope="app")
         
     except Exception as e:
         st.error(f"❌ Error clearing database: {e}")
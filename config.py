@@ -1,6 +1,8 @@
 # Configuration settings for the Client Hunter scraper
 
 import os
+import re
+from types import MappingProxyType
 from typing import Dict, List
 
 # Database settings
@@ -24,13 +26,13 @@ MAX_RETRIES = 3
 GOOGLE_MAPS_API_KEY = os.getenv('GOOGLE_MAPS_API_KEY')
 
 # User agents for rotation
-USER_AGENTS = [
+USER_AGENTS = (
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0'
-]
+)
 
 # Scraping sources configuration for REAL data
 REAL_SCRAPING_SOURCES = {
@@ -123,46 +125,84 @@ LOG_LEVEL = "INFO"
 LOG_FILE = "data/scraping.log"
 LOG_FORMAT = '%(asctime)s - %(levelname)s - %(module)s - %(message)s'
 
-# Browser settings for Playwright
-BROWSER_CONFIG = {
+# Browser settings for Playwright (read-only; shared by every launch)
+BROWSER_CONFIG = MappingProxyType({
     'headless': True,
     'viewport': {'width': 1366, 'height': 768},
     'user_agent': USER_AGENTS[0],
     'timeout': 30000,
-    'args': [
+    'args': (
         '--no-sandbox',
         '--disable-setuid-sandbox',
         '--disable-blink-features=AutomationControlled',
         '--disable-extensions',
         '--disable-plugins'
-    ]
-}
+    )
+})
 
-# Rate limiting
-RATE_LIMIT = {
+# Rate limiting (read-only)
+RATE_LIMIT = MappingProxyType({
     'requests_per_minute': 30,
     'concurrent_requests': 5,
     'burst_limit': 10
-}
+})
 
 # Data validation rules
-VALIDATION_RULES = {
+VALIDATION_RULES = MappingProxyType({
     'min_business_name_length': 2,
     'max_business_name_length': 200,
-    'required_fields': ['business_name', 'location'],
-    'phone_number_patterns': [
-        r'\+91[\s-]?[789]\d{9}',  # +91 format
-        r'91[\s-]?[789]\d{9}',    # 91 format
-        r'[789]\d{9}',            # 10 digit mobile
-        r'\d{3}[\s-]?\d{3}[\s-]?\d{4}',  # Generic
-    ],
+    'required_fields': ('business_name', 'location'),
+    'phone_number_patterns': (
+        r'(?<!\d)\+91[\s-]?[789]\d{9}(?!\d)',  # +91 format
+        r'(?<!\d)91[\s-]?[789]\d{9}(?!\d)',    # 91 format
+        r'(?<!\d)[789]\d{9}(?!\d)',            # 10 digit mobile
+        r'(?<!\d)\d{3}[\s-]?\d{3}[\s-]?\d{4}(?!\d)',  # Generic
+        r'\(\d{3}\)[\s-]?\d{3}[\s-]?\d{4}(?!\d)',  # (XXX) XXX-XXXX
+    ),
     'email_pattern': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-    'website_patterns': [
+    'website_patterns': (
         r'https?://[^\s<>"{}|\\^`\[\]]+',
         r'www\.[^\s<>"{}|\\^`\[\]]+',
-    ]
+    )
+})
+
+# Validation patterns compiled once at import time
+COMPILED_VALIDATION = {
+    'phone': [re.compile(p) for p in VALIDATION_RULES['phone_number_patterns']],
+    'email': re.compile(VALIDATION_RULES['email_pattern']),
+    'website': [re.compile(p, re.IGNORECASE) for p in VALIDATION_RULES['website_patterns']]
 }
 
+# All phone patterns as one alternation so text is scanned once
+PHONE_REGEX = re.compile('|'.join(f'(?:{p})' for p in VALIDATION_RULES['phone_number_patterns']))
+
+def find_phones(text: str) -> List[str]:
+    """Find phone numbers in text with the precompiled pattern."""
+    return PHONE_REGEX.findall(text)
+
+# Everything except digits and '+' is dropped from a phone number in one pass
+PHONE_STRIP_REGEX = re.compile(r'[^\d+]')
+
+def clean_phone(number: str) -> str:
+    """Reduce a phone number to its digits and '+' sign."""
+    return PHONE_STRIP_REGEX.sub('', number)
+
+def find_emails(text: str) -> List[str]:
+    """Find email addresses, skipping the regex when the text has no '@'."""
+    if '@' not in text:
+        return []
+    return COMPILED_VALIDATION['email'].findall(text)
+
+def find_websites(text: str) -> List[str]:
+    """Find website URLs, skipping the regexes when no URL marker is present."""
+    if '://' not in text and 'www.' not in text.lower():
+        return []
+    
+    urls = []
+    for pattern in COMPILED_VALIDATION['website']:
+        urls.extend(pattern.findall(text))
+    return urls
+
 # Error handling
 ERROR_HANDLING = {
     'max_consecutive_failures': 3,
@@ -1,28 +1,100 @@
 import sqlite3
 import os
+import csv
+import threading
+import time
+import functools
+from contextlib import contextmanager
+from itertools import islice, chain
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Iterable
 import logging
 
 class DatabaseManager:
     """Manages SQLite database operations for business data storage."""
     
-    def __init__(self, db_path: str = "data/businesses.db"):
-        """Initialize database manager with specified path."""
+    # Rows per multi-row INSERT when inserting in bulk
+    insert_chunk_size = 500
+    
+    # SQLite's default bound-parameter limit before 3.32
+    max_sql_variables = 999
+    
+    # Columns written to CSV exports, in file order
+    EXPORT_COLUMNS = ('business_name', 'contact', 'address', 'website',
+                      'category', 'location', 'scraped_at', 'source')
+    
+    # Columns written by insert_businesses_batch, in VALUES order
+    INSERT_COLUMNS = ('business_name', 'contact', 'address', 'website', 'category',
+                      'location', 'latitude', 'longitude', 'source')
+    
+    # Rows per fetchmany call when exporting
+    export_chunk_size = 5000
+    
+    # File buffer for exports, so each chunk reaches the disk in a few large writes
+    export_buffer_size = 1 << 20
+    
+    # Bump whenever init_database changes the schema; stored in PRAGMA user_version
+    SCHEMA_VERSION = 4
+    
+    # Cached geocoding results older than this are looked up again
+    geocode_max_age_days = 30
+    
+    def __init__(self, db_path: str = "data/businesses.db",
+                 connection: Optional[sqlite3.Connection] = None):
+        """Initialize database manager with specified path and a long-lived connection."""
         self.db_path = db_path
         self.ensure_directory_exists()
+        self.connection = connection or self.open_connection(db_path)
+        self._lock = threading.RLock()
+        self.fts_enabled = False
         self.init_database()
     
+    @staticmethod
+    def open_connection(db_path: str = "data/businesses.db") -> sqlite3.Connection:
+        """Open a long-lived SQLite connection tuned for repeated use."""
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+    
+    @contextmanager
+    def _connect(self):
+        """Yield the shared connection inside a transaction, one caller at a time."""
+        with self._lock, self.connection:
+            yield self.connection
+    
+    def close(self):
+        """Close the shared connection."""
+        with self._lock:
+            self.connection.close()
+    
     def ensure_directory_exists(self):
         """Create data directory if it doesn't exist."""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._make_directory(os.path.dirname(self.db_path))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _make_directory(directory: str):
+        """Create a directory once per process."""
+        if directory:
+            os.makedirs(directory, exist_ok=True)
     
     def init_database(self):
         """Initialize database with required tables."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
+                # Schema already current: skip the DDL and its write transaction
+                cursor.execute("PRAGMA user_version")
+                if cursor.fetchone()[0] == self.SCHEMA_VERSION:
+                    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'businesses_fts'")
+                    self.fts_enabled = cursor.fetchone() is not None
+                    return
+                
                 # Create businesses table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS businesses (
@@ -41,6 +113,15 @@ class DatabaseManager:
                     )
                 ''')
                 
+                # Index for the dashboard sort and date range; location and category are
+                # filtered with LIKE '%...%', which no index can serve, so they get none
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_businesses_scraped_at ON businesses(scraped_at)")
+                cursor.execute("DROP INDEX IF EXISTS idx_businesses_location")
+                cursor.execute("DROP INDEX IF EXISTS idx_businesses_category")
+                
+                # Full-text index for name/address/category search
+                self.fts_enabled = self._init_search_index(cursor)
+                
                 # Create scraping_sessions table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS scraping_sessions (
@@ -53,6 +134,26 @@ class DatabaseManager:
                     )
                 ''')
                 
+                # Create geocode_cache table, keyed by normalized address
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS geocode_cache (
+                        address_key TEXT PRIMARY KEY,
+                        latitude REAL NOT NULL,
+                        longitude REAL NOT NULL,
+                        fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                
+                # Create api_cache table for raw API response bodies (fetched_at in epoch seconds)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS api_cache (
+                        key TEXT PRIMARY KEY,
+                        body BLOB NOT NULL,
+                        fetched_at REAL NOT NULL
+                    )
+                ''')
+                
+                cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
                 conn.commit()
                 logging.info("Database initialized successfully")
                 
@@ -60,10 +161,68 @@ class DatabaseManager:
             logging.error(f"Database initialization error: {e}")
             raise
     
+    def _init_search_index(self, cursor) -> bool:
+        """Create the FTS5 search table and its sync triggers; False if FTS5 is unavailable."""
+        try:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'businesses_fts'")
+            exists = cursor.fetchone() is not None
+            
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS businesses_fts USING fts5(
+                    business_name, address, category,
+                    content='businesses', content_rowid='id'
+                )
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS businesses_fts_insert AFTER INSERT ON businesses BEGIN
+                    INSERT INTO businesses_fts(rowid, business_name, address, category)
+                    VALUES (new.id, new.business_name, new.address, new.category);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS businesses_fts_delete AFTER DELETE ON businesses BEGIN
+                    INSERT INTO businesses_fts(businesses_fts, rowid, business_name, address, category)
+                    VALUES ('delete', old.id, old.business_name, old.address, old.category);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS businesses_fts_update AFTER UPDATE ON businesses BEGIN
+                    INSERT INTO businesses_fts(businesses_fts, rowid, business_name, address, category)
+                    VALUES ('delete', old.id, old.business_name, old.address, old.category);
+                    INSERT INTO businesses_fts(rowid, business_name, address, category)
+                    VALUES (new.id, new.business_name, new.address, new.category);
+                END
+            ''')
+            
+            # Index rows that were stored before the search table existed
+            if not exists:
+                cursor.execute("INSERT INTO businesses_fts(businesses_fts) VALUES ('rebuild')")
+            
+            return True
+            
+        except sqlite3.OperationalError as e:
+            logging.warning(f"Full-text search unavailable, falling back to LIKE: {e}")
+            return False
+    
+    @staticmethod
+    def _fts_query(search_term: str) -> str:
+        """Turn free text into an FTS5 query matching every word as a prefix."""
+        tokens = search_term.replace('"', '""').split()
+        return ' '.join(f'"{token}"*' for token in tokens)
+    
+    @staticmethod
+    def _business_key(business: Dict[str, Any]) -> tuple:
+        """Key matching the businesses table UNIQUE(business_name, address, location) constraint."""
+        return (
+            business.get('business_name', ''),
+            business.get('address', ''),
+            business.get('location', '')
+        )
+    
     def insert_business(self, business_data: Dict[str, Any]) -> bool:
         """Insert business data into database."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -90,13 +249,31 @@ class DatabaseManager:
             logging.error(f"Error inserting business data: {e}")
             return False
     
-    def insert_businesses_batch(self, businesses: List[Dict[str, Any]]) -> int:
-        """Insert multiple businesses in a single transaction."""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
+    def insert_businesses_batch(self, businesses: Iterable[Dict[str, Any]]) -> int:
+        """Insert businesses from any iterable in a single transaction, chunk by chunk.
+        
+        Generators are consumed lazily, so only one chunk of rows is held at a time.
+        """
+        with self._lock:
+            conn = self.connection
+            try:
+                # Skip rows repeated within this batch; INSERT OR IGNORE handles stored ones.
+                # Keys holding NULL never collide under UNIQUE, so those rows always go through.
+                batch_keys = set()
+                
+                def new_businesses():
+                    for business in businesses:
+                        key = self._business_key(business)
+                        if None in key:
+                            yield business
+                        elif key not in batch_keys:
+                            batch_keys.add(key)
+                            yield business
+                
+                conn.execute("BEGIN IMMEDIATE")
                 cursor = conn.cursor()
                 
-                data_tuples = [
+                data_tuples = (
                     (
                         business.get('business_name', ''),
                         business.get('contact', ''),
@@ -108,75 +285,199 @@ class DatabaseManager:
                         business.get('longitude'),
                         business.get('source', '')
                     )
-                    for business in businesses
-                ]
-                
-                cursor.executemany('''
-                    INSERT OR IGNORE INTO businesses 
-                    (business_name, contact, address, website, category, location, 
-                     latitude, longitude, source)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', data_tuples)
+                    for business in new_businesses()
+                )
+                
+                # One multi-row INSERT per chunk, kept under the bound-parameter limit
+                chunk_size = min(self.insert_chunk_size,
+                                 self.max_sql_variables // len(self.INSERT_COLUMNS))
+                inserted = 0
+                while True:
+                    chunk = list(islice(data_tuples, chunk_size))
+                    if not chunk:
+                        break
+                    
+                    cursor.execute(self._insert_sql(len(chunk)), list(chain.from_iterable(chunk)))
+                    inserted += cursor.rowcount
                 
                 conn.commit()
+                return inserted
+                
+            except Exception as e:
+                conn.rollback()
+                logging.error(f"Error inserting batch businesses: {e}")
+                return 0
+    
+    def fill_missing_fields(self, businesses: Iterable[Dict[str, Any]]) -> int:
+        """Fill empty website and coordinates of stored businesses from the given records.
+        
+        Rows are matched on the UNIQUE(business_name, address, location) key; columns that
+        already hold a value are left alone.
+        """
+        try:
+            with self._connect() as conn:
+                cursor = conn.executemany('''
+                    UPDATE businesses SET
+                        website = CASE WHEN website IS NULL OR website = '' THEN ? ELSE website END,
+                        latitude = COALESCE(latitude, ?),
+                        longitude = COALESCE(longitude, ?)
+                    WHERE business_name IS ? AND address IS ? AND location IS ?
+                ''', [
+                    (business.get('website', ''), business.get('latitude'), business.get('longitude'))
+                    + self._business_key(business)
+                    for business in businesses
+                ])
                 return cursor.rowcount
                 
         except Exception as e:
-            logging.error(f"Error inserting batch businesses: {e}")
+            logging.error(f"Error filling business fields: {e}")
             return 0
     
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _insert_sql(cls, rows: int) -> str:
+        """Build the multi-row INSERT OR IGNORE statement for a chunk of the given size."""
+        placeholders = "(" + ", ".join("?" * len(cls.INSERT_COLUMNS)) + ")"
+        return (
+            f"INSERT OR IGNORE INTO businesses ({', '.join(cls.INSERT_COLUMNS)}) "
+            f"VALUES {', '.join([placeholders] * rows)}"
+        )
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _business_sql(columns: str, has_location: bool, has_category: bool,
+                      search_mode: Optional[str], has_start: bool, has_end: bool,
+                      has_limit: bool = False) -> str:
+        """Build the SELECT text for one combination of filters, once per combination."""
+        query = f"SELECT {columns} FROM businesses WHERE 1=1"
+        
+        if has_location:
+            query += " AND location LIKE ?"
+        
+        if has_category:
+            query += " AND category LIKE ?"
+        
+        if search_mode == 'fts':
+            query += " AND id IN (SELECT rowid FROM businesses_fts WHERE businesses_fts MATCH ?)"
+        elif search_mode == 'like':
+            query += " AND (business_name LIKE ? OR address LIKE ? OR category LIKE ?)"
+        
+        # Compare scraped_at directly so the index can serve the range
+        if has_start:
+            query += " AND scraped_at >= ?"
+        
+        if has_end:
+            query += " AND scraped_at < date(?, '+1 day')"
+        
+        query += " ORDER BY scraped_at DESC"
+        
+        if has_limit:
+            query += " LIMIT ?"
+        
+        return query
+    
+    def _business_query(self, columns: str = "*",
+                        location: Optional[str] = None,
+                        category: Optional[str] = None,
+                        start_date: Optional[str] = None,
+                        end_date: Optional[str] = None,
+                        search_term: Optional[str] = None,
+                        limit: Optional[int] = None) -> tuple:
+        """Return the cached filtered businesses SELECT and this call's parameters."""
+        params = []
+        search_mode = None
+        # A blank search term filters nothing rather than matching a run of spaces
+        search_term = search_term.strip() if search_term else None
+        
+        if location:
+            params.append(f"%{location}%")
+        
+        if category:
+            params.append(f"%{category}%")
+        
+        if search_term and self.fts_enabled:
+            search_mode = 'fts'
+            params.append(self._fts_query(search_term))
+        elif search_term:
+            search_mode = 'like'
+            params.extend([f"%{search_term}%"] * 3)
+        
+        if start_date:
+            params.append(start_date)
+        
+        if end_date:
+            params.append(end_date)
+        
+        if limit is not None:
+            params.append(limit)
+        
+        # Identical SQL text per filter combination also keeps sqlite3's statement cache warm
+        query = self._business_sql(columns, bool(location), bool(category),
+                                   search_mode, bool(start_date), bool(end_date),
+                                   limit is not None)
+        return query, params
+    
+    def iter_businesses(self, location: Optional[str] = None,
+                        category: Optional[str] = None,
+                        start_date: Optional[str] = None,
+                        end_date: Optional[str] = None,
+                        search_term: Optional[str] = None,
+                        limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield filtered businesses one row at a time straight from the cursor.
+        
+        The connection lock is held until the generator is exhausted or closed.
+        """
+        query, params = self._business_query("*", location, category, start_date, end_date,
+                                             search_term, limit)
+        
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(query, params)
+            for row in cursor:
+                yield dict(row)
+    
     def get_businesses(self, location: Optional[str] = None, 
                       category: Optional[str] = None,
                       start_date: Optional[str] = None,
-                      end_date: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Retrieve businesses with optional filters."""
+                      end_date: Optional[str] = None,
+                      search_term: Optional[str] = None,
+                      limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Retrieve businesses with optional filters (and row limit), all applied in SQL."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                
-                query = "SELECT * FROM businesses WHERE 1=1"
-                params = []
-                
-                if location:
-                    query += " AND location LIKE ?"
-                    params.append(f"%{location}%")
-                
-                if category:
-                    query += " AND category LIKE ?"
-                    params.append(f"%{category}%")
-                
-                if start_date:
-                    query += " AND date(scraped_at) >= ?"
-                    params.append(start_date)
-                
-                if end_date:
-                    query += " AND date(scraped_at) <= ?"
-                    params.append(end_date)
-                
-                query += " ORDER BY scraped_at DESC"
-                
-                cursor.execute(query, params)
-                rows = cursor.fetchall()
-                
-                return [dict(row) for row in rows]
+            return list(self.iter_businesses(location, category, start_date, end_date,
+                                             search_term, limit))
                 
         except Exception as e:
             logging.error(f"Error retrieving businesses: {e}")
             return []
     
     def search_businesses(self, search_term: str) -> List[Dict[str, Any]]:
-        """Search businesses by name, address, or category."""
+        """Search businesses by name, address, or category.
+        
+        With FTS5 every word must start a word in one of those columns ("tech" finds
+        "Technova" but "nova" does not); without it the whole term is a substring match.
+        A blank term returns every business either way.
+        """
+        search_term = search_term.strip()
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                
-                cursor.execute('''
-                    SELECT * FROM businesses 
-                    WHERE business_name LIKE ? OR address LIKE ? OR category LIKE ?
-                    ORDER BY scraped_at DESC
-                ''', (f"%{search_term}%", f"%{search_term}%", f"%{search_term}%"))
+                cursor.row_factory = sqlite3.Row
+                
+                if self.fts_enabled and search_term:
+                    cursor.execute('''
+                        SELECT b.* FROM businesses_fts f
+                        JOIN businesses b ON b.id = f.rowid
+                        WHERE businesses_fts MATCH ?
+                        ORDER BY b.scraped_at DESC
+                    ''', (self._fts_query(search_term),))
+                else:
+                    cursor.execute('''
+                        SELECT * FROM businesses 
+                        WHERE business_name LIKE ? OR address LIKE ? OR category LIKE ?
+                        ORDER BY scraped_at DESC
+                    ''', (f"%{search_term}%", f"%{search_term}%", f"%{search_term}%"))
                 
                 rows = cursor.fetchall()
                 return [dict(row) for row in rows]
@@ -188,7 +489,7 @@ class DatabaseManager:
     def get_statistics(self) -> Dict[str, Any]:
         """Get database statistics."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Total businesses
@@ -228,7 +529,7 @@ class DatabaseManager:
     def create_scraping_session(self, location: str) -> int:
         """Create a new scraping session and return session ID."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -246,7 +547,7 @@ class DatabaseManager:
     def update_scraping_session(self, session_id: int, total_scraped: int, status: str = 'completed'):
         """Update scraping session with results."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -263,9 +564,9 @@ class DatabaseManager:
     def get_session_stats(self, session_id: int) -> Dict[str, Any]:
         """Get statistics for a specific scraping session."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._connect() as conn:
                 cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
                 
                 cursor.execute('''
                     SELECT *, 
@@ -298,27 +599,110 @@ class DatabaseManager:
             logging.error(f"Error getting session stats: {e}")
             return {}
     
+    def get_cached_coordinates(self, address_key: str,
+                               max_age_days: Optional[int] = None) -> Optional[Dict[str, float]]:
+        """Return cached coordinates for a normalized address if they are fresh enough."""
+        max_age_days = self.geocode_max_age_days if max_age_days is None else max_age_days
+        try:
+            with self._connect() as conn:
+                row = conn.execute('''
+                    SELECT latitude, longitude FROM geocode_cache
+                    WHERE address_key = ? AND fetched_at >= datetime('now', ?)
+                ''', (address_key, f"-{max_age_days} days")).fetchone()
+                
+                if row:
+                    return {'latitude': row[0], 'longitude': row[1]}
+                return None
+                
+        except Exception as e:
+            logging.error(f"Error reading geocode cache: {e}")
+            return None
+    
+    def cache_coordinates(self, address_key: str, latitude: float, longitude: float):
+        """Store (or refresh) the coordinates for a normalized address."""
+        try:
+            with self._connect() as conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO geocode_cache (address_key, latitude, longitude, fetched_at)
+                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                ''', (address_key, latitude, longitude))
+                
+        except Exception as e:
+            logging.error(f"Error writing geocode cache: {e}")
+    
+    def get_cached_response(self, key: str, max_age_seconds: float) -> Optional[bytes]:
+        """Return a cached API response body if it is younger than max_age_seconds."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT body FROM api_cache WHERE key = ? AND fetched_at >= ?",
+                    (key, time.time() - max_age_seconds)
+                ).fetchone()
+                return row[0] if row else None
+                
+        except Exception as e:
+            logging.error(f"Error reading API cache: {e}")
+            return None
+    
+    def cache_response(self, key: str, body: bytes):
+        """Store (or refresh) an API response body."""
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO api_cache (key, body, fetched_at) VALUES (?, ?, ?)",
+                    (key, body, time.time())
+                )
+                
+        except Exception as e:
+            logging.error(f"Error writing API cache: {e}")
+    
+    def clear_all_data(self) -> int:
+        """Delete all businesses and scraping sessions in one transaction."""
+        with self._lock:
+            conn = self.connection
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                removed = conn.execute("DELETE FROM businesses").rowcount
+                conn.execute("DELETE FROM scraping_sessions")
+                conn.commit()
+                return removed
+            except Exception:
+                conn.rollback()
+                raise
+    
+    def write_csv(self, csvfile, location: Optional[str] = None) -> int:
+        """Write the CSV header and matching businesses to an open text file; return the row count."""
+        # Select exactly the exported columns so cursor tuples can be written as-is
+        query, params = self._business_query(', '.join(self.EXPORT_COLUMNS), location=location)
+        written = 0
+        
+        with self._connect() as conn:
+            cursor = conn.execute(query, params)
+            writer = csv.writer(csvfile)
+            writer.writerow(self.EXPORT_COLUMNS)
+            
+            # Write chunk by chunk so only export_chunk_size rows are held at once
+            rows = cursor.fetchmany(self.export_chunk_size)
+            while rows:
+                writer.writerows(rows)
+                written += len(rows)
+                rows = cursor.fetchmany(self.export_chunk_size)
+        
+        return written
+    
     def export_to_csv(self, filename: str, location: Optional[str] = None) -> bool:
         """Export businesses to CSV file."""
         try:
-            import csv
-            
-            businesses = self.get_businesses(location=location)
-            
-            if not businesses:
+            if not self.get_businesses(location=location, limit=1):
                 return False
             
+            # Directory check is memoized, so repeat exports skip the stat
+            self._make_directory("data")
             filepath = os.path.join("data", filename)
             
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['business_name', 'contact', 'address', 'website', 
-                            'category', 'location', 'scraped_at', 'source']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for business in businesses:
-                    row = {field: business.get(field, '') for field in fieldnames}
-                    writer.writerow(row)
+            with open(filepath, 'w', newline='', encoding='utf-8',
+                      buffering=self.export_buffer_size) as csvfile:
+                self.write_csv(csvfile, location=location)
             
             return True
             
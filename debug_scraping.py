@@ -8,29 +8,209 @@ import ssl
 import logging
 from selectolax.parser import HTMLParser
 from urllib.parse import quote_plus
+from pathlib import Path
 import json
+import re
+
+from config import RATE_LIMIT
+
+# orjson parses embedded page JSON much faster when installed; stdlib otherwise
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Phone numbers are scanned on the raw response bytes, before any decoding
+PHONE_PATTERN_BYTES = re.compile(rb'(?<!\d)(?:\+91[-\s]?)?[6-9]\d{9}(?!\d)')
+
+# Candidate business names, tried in order
+NAME_PATTERNS_BYTES = [
+    re.compile(rb'"business_name":\s*"([^"]+)"', re.IGNORECASE),
+    re.compile(rb'"name":\s*"([^"]+)"', re.IGNORECASE),
+    re.compile(rb'<h[1-6][^>]*>([^<]+)</h[1-6]>', re.IGNORECASE)
+]
+
+# Connection pool settings shared by every probe request
+CONNECTOR_OPTIONS = {
+    'limit': RATE_LIMIT['concurrent_requests'],
+    'limit_per_host': 5,
+    'ttl_dns_cache': 300,
+    'keepalive_timeout': 60,
+    'enable_cleanup_closed': True
+}
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+def extract_json_objects(text: str, needle: str = '"business') -> list:
+    """Return the innermost balanced {...} span enclosing each occurrence of needle.
+
+    One string-aware pass tracks the open braces. Spans nested inside an earlier
+    returned span are dropped, so each object is returned once.
+    """
+    needles = [match.start() for match in re.finditer(re.escape(needle), text)]
+    if not needles:
+        return []
+
+    open_braces = []
+    wanted = set()
+    spans = []
+    next_needle = 0
+    in_string = False
+    escaped = False
+
+    for offset, char in enumerate(text):
+        if next_needle < len(needles) and offset == needles[next_needle]:
+            if open_braces:
+                wanted.add(open_braces[-1])
+            next_needle += 1
+
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            open_braces.append(offset)
+        elif char == '}' and open_braces:
+            start = open_braces.pop()
+            if start in wanted:
+                wanted.discard(start)
+                spans.append((start, offset))
+
+        # Every needle seen and every object enclosing one closed: nothing left to find
+        if next_needle == len(needles) and not wanted:
+            break
+
+    objects = []
+    last_end = -1
+    for start, end in sorted(spans):
+        if start > last_end:
+            objects.append(text[start:end + 1])
+            last_end = end
+
+    return objects
+
+async def fetch_page(session: aiohttp.ClientSession, url: str):
+    """Fetch a URL and return its status and raw body (on 200)."""
+    async with session.get(url) as response:
+        if response.status == 200:
+            return response.status, await response.read()
+        return response.status, None
+
+async def save_html(index: int, raw_html: bytes):
+    """Save a fetched page for inspection without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, Path(f"debug_html_{index}.html").write_bytes, raw_html)
+
+def analyze_html(raw_html: bytes):
+    """Print what business data can be found in a fetched page, working on raw bytes."""
+    print(f"   HTML Length: {len(raw_html)} bytes")
+
+    # Try to parse and find business data (selectolax detects the encoding itself)
+    parser = HTMLParser(raw_html)
+
+    # Look for JSON data that might contain business info
+    scripts = parser.css('script')
+    json_found = False
+
+    for script in scripts:
+        script_text = script.text() or ""
+        if 'business' in script_text.lower() or 'listing' in script_text.lower():
+            if len(script_text) > 100:  # Only check substantial scripts
+                print(f"   Found potential JSON script: {script_text[:200]}...")
+                json_found = True
+
+                # Try to extract JSON
+                try:
+                    # Look for JSON objects mentioning a business
+                    matches = extract_json_objects(script_text)
+                    if matches:
+                        print(f"   Found JSON matches: {len(matches)}")
+
+                    decoded = []
+                    for match in matches:
+                        try:
+                            decoded.append(json_loads(match))
+                        except ValueError:
+                            continue
+                    if decoded:
+                        print(f"   Decoded JSON objects: {len(decoded)}")
+                except:
+                    pass
+
+    if not json_found:
+        print("   No JSON data found in scripts")
+
+    # Test different selectors
+    selectors_to_test = [
+        '.resultbox',
+        '.store-details',
+        '.listing-card',
+        '.business-card',
+        '.result-item',
+        '[data-track*="listing"]',
+        '.cont_sw_container',
+        '.store',
+        '.listing',
+        '[class*="result"]',
+        '[class*="business"]',
+        '[class*="store"]',
+        'div[id*="business"]',
+        'div[id*="store"]'
+    ]
+
+    for selector in selectors_to_test:
+        elements = parser.css(selector)
+        if elements:
+            print(f"   ✅ Found {len(elements)} elements with selector: {selector}")
+
+            # Show sample of first element
+            if elements[0].text():
+                sample_text = elements[0].text()[:100]
+                print(f"      Sample text: {sample_text}...")
+            break
+    else:
+        print("   ❌ No business elements found with any selector")
+
+    # Look for phone numbers in the HTML
+    phones = PHONE_PATTERN_BYTES.findall(raw_html)
+    if phones:
+        print(f"   📞 Found {len(phones)} phone numbers in HTML")
+    else:
+        print("   📞 No phone numbers found")
+
+    # Look for business names
+    for pattern in NAME_PATTERNS_BYTES:
+        names = pattern.findall(raw_html)
+        if names:
+            print(f"   🏪 Found {len(names)} potential business names")
+            print(f"      Sample: {names[0].decode('utf-8', errors='replace') if names else 'None'}")
+            break
+
 async def debug_justdial_scraping():
     """Debug JustDial scraping to see what we're actually getting."""
-    
+
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.9',
         'Connection': 'keep-alive'
     }
-    
-    connector = aiohttp.TCPConnector(ssl=ssl.create_default_context())
-    
+
+    connector = aiohttp.TCPConnector(ssl=ssl.create_default_context(), **CONNECTOR_OPTIONS)
+
     async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
         try:
             # Test actual JustDial URL
             location = "delhi"
             category = "restaurants"
-            
+
             # Try different URL formats
             urls_to_try = [
                 f"https://www.justdial.com/{quote_plus(category)}/{quote_plus(location)}",
@@ -38,116 +218,39 @@ async def debug_justdial_scraping():
                 f"https://www.justdial.com/{location}/{category}",
                 f"https://www.justdial.com/delhincr/{category}"
             ]
-            
-            for i, url in enumerate(urls_to_try):
+
+            # Probe all URL formats at once over the shared connection pool
+            results = await asyncio.gather(
+                *(fetch_page(session, url) for url in urls_to_try),
+                return_exceptions=True
+            )
+
+            for i, (url, result) in enumerate(zip(urls_to_try, results)):
                 print(f"\n🔍 Testing URL {i+1}: {url}")
-                
-                try:
-                    async with session.get(url) as response:
-                        print(f"   Status: {response.status}")
-                        
-                        if response.status == 200:
-                            html = await response.text()
-                            print(f"   HTML Length: {len(html)} characters")
-                            
-                            # Save HTML for inspection
-                            with open(f"debug_html_{i+1}.html", "w", encoding="utf-8") as f:
-                                f.write(html)
-                            
-                            # Try to parse and find business data
-                            parser = HTMLParser(html)
-                            
-                            # Look for JSON data that might contain business info
-                            scripts = parser.css('script')
-                            json_found = False
-                            
-                            for script in scripts:
-                                script_text = script.text() or ""
-                                if 'business' in script_text.lower() or 'listing' in script_text.lower():
-                                    if len(script_text) > 100:  # Only check substantial scripts
-                                        print(f"   Found potential JSON script: {script_text[:200]}...")
-                                        json_found = True
-                                        
-                                        # Try to extract JSON
-                                        try:
-                                            # Look for JSON patterns
-                                            import re
-                                            json_pattern = r'\{.*?"business.*?".*?\}'
-                                            matches = re.findall(json_pattern, script_text, re.DOTALL)
-                                            if matches:
-                                                print(f"   Found JSON matches: {len(matches)}")
-                                        except:
-                                            pass
-                            
-                            if not json_found:
-                                print("   No JSON data found in scripts")
-                            
-                            # Test different selectors
-                            selectors_to_test = [
-                                '.resultbox',
-                                '.store-details', 
-                                '.listing-card',
-                                '.business-card',
-                                '.result-item',
-                                '[data-track*="listing"]',
-                                '.cont_sw_container',
-                                '.store',
-                                '.listing',
-                                '[class*="result"]',
-                                '[class*="business"]',
-                                '[class*="store"]',
-                                'div[id*="business"]',
-                                'div[id*="store"]'
-                            ]
-                            
-                            for selector in selectors_to_test:
-                                elements = parser.css(selector)
-                                if elements:
-                                    print(f"   ✅ Found {len(elements)} elements with selector: {selector}")
-                                    
-                                    # Show sample of first element
-                                    if elements[0].text():
-                                        sample_text = elements[0].text()[:100]
-                                        print(f"      Sample text: {sample_text}...")
-                                    break
-                            else:
-                                print("   ❌ No business elements found with any selector")
-                            
-                            # Look for phone numbers in the HTML
-                            import re
-                            phone_pattern = r'(\+91[-\s]?)?[6-9]\d{9}'
-                            phones = re.findall(phone_pattern, html)
-                            if phones:
-                                print(f"   📞 Found {len(phones)} phone numbers in HTML")
-                            else:
-                                print("   📞 No phone numbers found")
-                            
-                            # Look for business names
-                            name_patterns = [
-                                r'"business_name":\s*"([^"]+)"',
-                                r'"name":\s*"([^"]+)"',
-                                r'<h[1-6][^>]*>([^<]+)</h[1-6]>'
-                            ]
-                            
-                            for pattern in name_patterns:
-                                names = re.findall(pattern, html, re.IGNORECASE)
-                                if names:
-                                    print(f"   🏪 Found {len(names)} potential business names")
-                                    print(f"      Sample: {names[0] if names else 'None'}")
-                                    break
-                            
-                            break  # If we got a 200 response, stop trying other URLs
-                        
-                        elif response.status == 403:
-                            print("   ❌ Access forbidden (403)")
-                        elif response.status == 404:
-                            print("   ❌ Not found (404)")
-                        else:
-                            print(f"   ❌ HTTP Error: {response.status}")
-                
-                except Exception as e:
-                    print(f"   ❌ Error: {e}")
-        
+
+                if isinstance(result, Exception):
+                    print(f"   ❌ Error: {result}")
+                    continue
+
+                status, raw_html = result
+                print(f"   Status: {status}")
+
+                if status == 200:
+                    try:
+                        await save_html(i + 1, raw_html)
+                        analyze_html(raw_html)
+                    except Exception as e:
+                        print(f"   ❌ Error: {e}")
+
+                    break  # If we got a 200 response, stop reporting other URLs
+
+                elif status == 403:
+                    print("   ❌ Access forbidden (403)")
+                elif status == 404:
+                    print("   ❌ Not found (404)")
+                else:
+                    print(f"   ❌ HTTP Error: {status}")
+
         except Exception as e:
             print(f"❌ Session error: {e}")
 
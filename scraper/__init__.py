@@ -1,15 +1,34 @@
 # Scraper module
-from .business_scraper import BusinessScraper
-from .directory_scrapers import JustDialScraper, IndiaMArtScraper, YellowPagesScraper
-from .maps_scraper import GoogleMapsScraper, PlaywrightScraper
-from .it_client_targeting import ITClientTargetingScraper
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562), so importing one
+# scraper does not pull in every other scraper's dependencies
+_LAZY = {
+    'BusinessScraper': '.business_scraper',
+    'JustDialScraper': '.directory_scrapers',
+    'IndiaMArtScraper': '.directory_scrapers',
+    'YellowPagesScraper': '.directory_scrapers',
+    'GoogleMapsScraper': '.maps_scraper',
+    'PlaywrightScraper': '.maps_scraper',
+    'ITClientTargetingScraper': '.it_client_targeting'
+}
 
 __all__ = [
     'BusinessScraper',
-    'JustDialScraper', 
-    'IndiaMArtScraper', 
+    'JustDialScraper',
+    'IndiaMArtScraper',
     'YellowPagesScraper',
     'GoogleMapsScraper',
     'PlaywrightScraper',
     'ITClientTargetingScraper'
 ]
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
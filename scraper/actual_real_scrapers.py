@@ -9,6 +9,7 @@ import logging
 import os
 import ssl
 import json
+import hashlib
 import re
 from typing import List, Dict, Any, Optional
 from selectolax.parser import HTMLParser
@@ -16,14 +17,168 @@ from urllib.parse import urljoin, quote_plus, urlparse
 from datetime import datetime
 import time
 import random
+from types import MappingProxyType
+
+from config import RATE_LIMIT, clean_phone
+from utils.rate_limit import AsyncTokenBucket
+
+# orjson parses embedded page JSON much faster when installed; stdlib otherwise
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# aiohttp's AsyncResolver needs aiodns; without it the default threaded resolver is used
+try:
+    import aiodns  # noqa: F401
+    HAS_AIODNS = True
+except ImportError:
+    HAS_AIODNS = False
+
+# JustDial embedded-data patterns, tried in order, each with a literal it cannot match without.
+# JustDial pages are scanned as raw response bytes, so these are bytes patterns.
+JSON_DATA_PATTERNS = tuple((anchor, re.compile(p, re.DOTALL)) for anchor, p in (
+    (b'__NEXT_DATA__', rb'__NEXT_DATA__["\']?\s*=\s*({.+?})\s*;'),
+    (b'__INITIAL_STATE__', rb'window\.__INITIAL_STATE__\s*=\s*({.+?})\s*;'),
+    (b'"results":', rb'"results":\s*(\[.+?\])'),
+    (b'"businesses":', rb'"businesses":\s*(\[.+?\])'),
+    (b'"docid":', rb'"docid":\s*"([^"]+)"'),
+    (b'"compname":', rb'"compname":\s*"([^"]+)"')
+))
+JSON_DATA_ANCHORS = tuple(anchor for anchor, _ in JSON_DATA_PATTERNS)
+# Class name of JustDial listing cards in the server-rendered HTML
+RESULTBOX_MARKER = b'resultbox'
+COMPNAME_PATTERN = re.compile(rb'"compname":\s*"([^"]+)"')
+DOCID_PATTERN = re.compile(rb'"docid":\s*"([^"]+)"')
+
+# Phone formats found in listing text, most specific first
+PHONE_PATTERNS = tuple(re.compile(p) for p in (
+    r'(\+91[-\s]?)?[6-9]\d{9}',
+    r'\b\d{3}[-\s]?\d{3}[-\s]?\d{4}\b',
+    r'\b\d{10}\b'
+))
+MOBILE_PATTERN = PHONE_PATTERNS[0]
+
+# Navigation/UI words that disqualify a candidate business name
+SKIP_NAME_PATTERN = re.compile(r'more|rating|reviews|call|view', re.IGNORECASE)
+SKIP_LINE_PATTERN = re.compile(r'rating|reviews|more|call|book|view', re.IGNORECASE)
+
+# JSON fields that may hold a listing's phone number, in priority order
+_PHONE_FIELDS = ('mobile', 'phone', 'contact', 'telephone', 'mob', 'phoneNumber')
+# Ten or more digits with optional leading '+' and common separators in between
+_PHONE_CANDIDATE = re.compile(r'\+?\d(?:[\s().-]*\d){9,}')
+
+# Built once: loading the CA bundle is the expensive part of an SSLContext
+SSL_CONTEXT = ssl.create_default_context()
+SSL_CONTEXT.set_alpn_protocols(['http/1.1'])
+
+# JustDial .resultbox field selectors, in priority order
+NAME_SELECTORS = (
+    '.fn', '.lng_cont_name', '.store-name',
+    'h3', 'h4', '.title', '[class*="name"]',
+    'a[class*="name"]', '.business-name'
+)
+ADDRESS_SELECTORS = (
+    '.address', '.adr', '.location', '.addr',
+    '[class*="address"]', '[class*="location"]',
+    '.store-address', '.business-address'
+)
+WEBSITE_SELECTORS = ('a[href*="http"]', '.website', '[class*="website"]')
+
+# Common categories mapped to JustDial's URL terms, keyed by casefolded category
+JUSTDIAL_CATEGORIES = MappingProxyType({
+    'restaurants': 'Restaurants',
+    'it companies': 'Software-Companies',
+    'software companies': 'Software-Companies',
+    'hotels': 'Hotels',
+    'hospitals': 'Hospitals',
+    'schools': 'Schools',
+    'banks': 'Banks',
+    'grocery stores': 'Grocery-Stores',
+    'beauty parlours': 'Beauty-Parlours',
+    'car repair': 'Car-Repair-Services',
+    'plumbers': 'Plumbers',
+    'electricians': 'Electricians',
+    'shops': 'General-Stores',
+    'services': 'Services'
+})
+
+# Keys whose list values hold business records in embedded JSON
+BUSINESS_ARRAY_KEYS = frozenset(('results', 'businesses', 'listings', 'data'))
+
+
+def first_per_selector(element, selectors):
+    """Yield the first match of each selector, in priority order."""
+    for selector in selectors:
+        node = element.css_first(selector)
+        if node is not None:
+            yield node
+
+
+def first_text(element, selector: str) -> str:
+    """Return the stripped text of the first node matching selector, or "" when none does."""
+    node = element.css_first(selector)
+    return node.text().strip() if node else ""
+
+
+def create_rate_limiter(requests_per_minute: float = RATE_LIMIT['requests_per_minute'],
+                        burst_limit: int = RATE_LIMIT['burst_limit']) -> AsyncTokenBucket:
+    """Create the token-bucket limiter shared by the real scrapers."""
+    return AsyncTokenBucket(capacity=burst_limit, rate=requests_per_minute / 60)
+
+
+def create_shared_session() -> aiohttp.ClientSession:
+    """Create one pooled aiohttp session to be shared by all real scrapers in a run."""
+    # Keep idle sockets long enough to be reused across search terms and sources
+    connector = aiohttp.TCPConnector(
+        limit=32,
+        limit_per_host=4,
+        ssl=SSL_CONTEXT,
+        resolver=aiohttp.AsyncResolver() if HAS_AIODNS else None,
+        ttl_dns_cache=600,
+        use_dns_cache=True,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+        force_close=False
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        # Stalled sockets fail within seconds; total only caps slowly trickling bodies
+        timeout=aiohttp.ClientTimeout(total=30, connect=5, sock_connect=5, sock_read=8),
+        cookie_jar=aiohttp.CookieJar()
+    )
+
+
+# Hosts that answered 403, mapped to the monotonic time their cool-down ends
+BLOCK_COOLDOWN = 300
+_blocked_until: Dict[str, float] = {}
+
+
+def host_blocked(url: str) -> bool:
+    """Return True while the URL's host is cooling down after a 403."""
+    return time.monotonic() < _blocked_until.get(urlparse(url).netloc, 0)
+
+
+def mark_blocked(url: str):
+    """Skip further requests to the URL's host for BLOCK_COOLDOWN seconds."""
+    _blocked_until[urlparse(url).netloc] = time.monotonic() + BLOCK_COOLDOWN
+
 
 class ActualJustDialScraper:
     """Actual JustDial scraper that makes real HTTP requests."""
     
-    def __init__(self, utils):
+    # Upper bound on requests in flight to any one JustDial host
+    max_requests_per_host = 3
+    
+    def __init__(self, utils, rate_limiter: Optional[AsyncTokenBucket] = None):
         self.utils = utils
+        self.rate_limiter = rate_limiter or create_rate_limiter()
         self.base_url = "https://www.justdial.com"
         self.session = None
+        self._owns_session = True
+        # Per-host semaphores, rebuilt for every search since they belong to its event loop
+        self._host_slots = {}
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -37,24 +192,19 @@ class ActualJustDialScraper:
             'Sec-Fetch-Site': 'none'
         }
     
+    def use_session(self, session: Optional[aiohttp.ClientSession]):
+        """Borrow a caller-owned session instead of opening one per search."""
+        self.session = session
+        self._owns_session = session is None
+    
     async def init_session(self):
         """Initialize aiohttp session for real web requests."""
+        if not self._owns_session:
+            return True
+        
         try:
-            connector = aiohttp.TCPConnector(
-                limit=10,
-                limit_per_host=3,
-                ssl=ssl.create_default_context(),
-                ttl_dns_cache=300,
-                use_dns_cache=True
-            )
-            timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            
-            self.session = aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout,
-                headers=self.headers,
-                cookie_jar=aiohttp.CookieJar()
-            )
+            # Requests pass self.headers explicitly, so the shared pool settings fit as-is
+            self.session = create_shared_session()
             logging.info("Actual JustDial session initialized for real web scraping")
             return True
         except Exception as e:
@@ -63,7 +213,7 @@ class ActualJustDialScraper:
     
     async def close_session(self):
         """Close aiohttp session."""
-        if self.session:
+        if self.session and self._owns_session:
             try:
                 await self.session.close()
                 await asyncio.sleep(0.1)
@@ -72,11 +222,13 @@ class ActualJustDialScraper:
     
     async def search_businesses(self, location: str, category: str = "", max_pages: int = 2) -> List[Dict[str, Any]]:
         """Make actual HTTP requests to JustDial and parse real business data."""
-        businesses = []
+        # Keyed by normalized name so duplicates are dropped as pages arrive
+        businesses = {}
+        self._host_slots = {}
         
         if not await self.init_session():
             logging.error("Failed to initialize session for real JustDial scraping")
-            return businesses
+            return []
         
         try:
             # Prepare search terms
@@ -86,71 +238,26 @@ class ActualJustDialScraper:
             else:
                 search_terms = ["restaurants", "shops", "services"]
             
-            for term in search_terms[:2]:  # Limit to avoid rate limiting
-                logging.info(f"Making REAL HTTP request to JustDial for '{term}' in {location}")
-                
-                try:
-                    # Build actual JustDial search URL for business listings
-                    # Different URL formats to try:
-                    # 1. Direct category page: https://www.justdial.com/Mumbai/Restaurants
-                    # 2. Search page: https://www.justdial.com/Mumbai/search/Restaurants  
-                    # 3. Mobile version: https://m.justdial.com/Mumbai/Restaurants
-                    
-                    # Map common categories to JustDial terms
-                    category_mapping = {
-                        'restaurants': 'Restaurants',
-                        'it companies': 'Software-Companies',
-                        'software companies': 'Software-Companies', 
-                        'hotels': 'Hotels',
-                        'hospitals': 'Hospitals',
-                        'schools': 'Schools',
-                        'banks': 'Banks',
-                        'grocery stores': 'Grocery-Stores',
-                        'beauty parlours': 'Beauty-Parlours',
-                        'car repair': 'Car-Repair-Services',
-                        'plumbers': 'Plumbers',
-                        'electricians': 'Electricians',
-                        'shops': 'General-Stores',
-                        'services': 'Services'
-                    }
-                    
-                    # Get the proper JustDial category term
-                    jd_category = category_mapping.get(term.lower(), term.replace(' ', '-').title())
-                    
-                    # Try multiple URL formats to find actual business listings
-                    urls_to_try = [
-                        # Direct category URL - most likely to have business listings
-                        f"{self.base_url}/{location.title()}/{jd_category}",
-                        # Search with 'near' keyword
-                        f"{self.base_url}/{location.title()}/{jd_category}-near-me", 
-                        # Mobile version
-                        f"https://m.justdial.com/{location.title()}/{jd_category}",
-                        # Original search format as fallback
-                        f"{self.base_url}/search-{quote_plus(term)}-{quote_plus(location)}"
-                    ]
-                    
-                    page_businesses = None
-                    for search_url in urls_to_try:
-                        logging.info(f"Trying JustDial URL: {search_url}")
-                        page_businesses = await self._scrape_actual_page(search_url, term, location)
-                        
-                        if page_businesses:
-                            logging.info(f"Success! Found {len(page_businesses)} businesses with: {search_url}")
-                            break
-                        else:
-                            logging.warning(f"No businesses found with: {search_url}")
-                    
-                    if page_businesses:
-                        businesses.extend(page_businesses)
-                    else:
-                        logging.warning(f"No businesses found with any URL format for {term}")
-                    
-                    # Respectful delay between requests
-                    await asyncio.sleep(random.uniform(3, 5))
-                    
-                except Exception as e:
-                    logging.error(f"Error in real JustDial scraping for '{term}': {e}")
-                    continue
+            # Terms are scraped concurrently; the shared rate limiter still paces requests
+            semaphore = asyncio.Semaphore(2)
+            
+            async def run_term(term):
+                async with semaphore:
+                    # Stagger the terms so they don't reach the host in one synchronized burst
+                    await asyncio.sleep(random.uniform(0, 2))
+                    return await self._scrape_term(term, location)
+            
+            search_terms = search_terms[:2]  # Limit to avoid rate limiting
+            results = await asyncio.gather(*(run_term(term) for term in search_terms))
+            
+            for term, page_businesses in zip(search_terms, results):
+                if page_businesses:
+                    for business in page_businesses:
+                        name = business.get('business_name', '').casefold().strip()
+                        if name:
+                            businesses.setdefault(name, business)
+                else:
+                    logging.warning(f"No businesses found with any URL format for {term}")
         
         except Exception as e:
             logging.error(f"Error in actual JustDial search: {e}")
@@ -158,16 +265,80 @@ class ActualJustDialScraper:
         finally:
             await self.close_session()
         
-        # Remove duplicates
-        unique_businesses = self._remove_duplicates(businesses)
+        unique_businesses = list(businesses.values())
         logging.info(f"Actual JustDial scraping found {len(unique_businesses)} real businesses")
         return unique_businesses
     
+    async def _scrape_term(self, term: str, location: str) -> List[Dict[str, Any]]:
+        """Scrape JustDial listings for one search term."""
+        logging.info(f"Making REAL HTTP request to JustDial for '{term}' in {location}")
+        
+        try:
+            # Build actual JustDial search URL for business listings
+            # Different URL formats to try:
+            # 1. Direct category page: https://www.justdial.com/Mumbai/Restaurants
+            # 2. Search page: https://www.justdial.com/Mumbai/search/Restaurants  
+            # 3. Mobile version: https://m.justdial.com/Mumbai/Restaurants
+            
+            # Get the proper JustDial category term
+            jd_category = JUSTDIAL_CATEGORIES.get(term.casefold()) or term.replace(' ', '-').title()
+            
+            # Try multiple URL formats to find actual business listings
+            urls_to_try = [
+                # Direct category URL - most likely to have business listings
+                f"{self.base_url}/{location.title()}/{jd_category}",
+                # Search with 'near' keyword
+                f"{self.base_url}/{location.title()}/{jd_category}-near-me", 
+                # Mobile version
+                f"https://m.justdial.com/{location.title()}/{jd_category}",
+                # Original search format as fallback
+                f"{self.base_url}/search-{quote_plus(term)}-{quote_plus(location)}"
+            ]
+            
+            businesses = await self._first_successful_page(urls_to_try, term, location)
+            if businesses:
+                return businesses
+            
+            # Every URL variant failed; the fallback runs once per term, not once per variant
+            return await self._fallback_scraping(location, term)
+            
+        except Exception as e:
+            logging.error(f"Error in real JustDial scraping for '{term}': {e}")
+            return []
+    
+    async def _first_successful_page(self, urls: List[str], category: str, location: str) -> List[Dict[str, Any]]:
+        """Fetch all candidate URLs at once and keep the highest-priority one that yields businesses."""
+        tasks = [asyncio.ensure_future(self._scrape_actual_page(url, category, location)) for url in urls]
+        try:
+            # Awaited in URL order, so the result does not depend on which host answers first
+            for task in tasks:
+                page_businesses = await task
+                if page_businesses:
+                    logging.info(f"Success! Found {len(page_businesses)} businesses for '{category}'")
+                    return page_businesses
+            return []
+        finally:
+            # Drop the lower-priority candidates once one has succeeded
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        """Return the semaphore limiting concurrent requests to the URL's host."""
+        host = urlparse(url).netloc
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.max_requests_per_host)
+        return self._host_slots[host]
+    
     async def _scrape_actual_page(self, url: str, category: str, location: str) -> List[Dict[str, Any]]:
         """Make actual HTTP request and parse real HTML content."""
         businesses = []
         
         try:
+            if host_blocked(url):
+                logging.info("Skipping %s - host recently answered 403", url)
+                return businesses
+            
             logging.info(f"Fetching real data from: {url}")
             
             if not self.session:
@@ -175,31 +346,35 @@ class ActualJustDialScraper:
                     logging.error("Failed to initialize session for JustDial scraping")
                     return businesses
                     
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    logging.info(f"Successfully fetched {len(html)} characters of HTML from JustDial")
-                    
-                    # Parse actual HTML content
-                    businesses = self._parse_real_html(html, category, location)
-                    
-                elif response.status == 403:
-                    logging.warning("JustDial blocked the request (403). Using alternative approach.")
-                    # Fallback to a simpler approach
-                    businesses = await self._fallback_scraping(location, category)
-                    
-                else:
-                    logging.warning(f"JustDial returned status {response.status} for URL: {url}")
+            async with self._host_slot(url), self.rate_limiter:
+                # A 403 may have tripped the breaker while this request waited for its slot
+                if host_blocked(url):
+                    logging.info("Skipping %s - host recently answered 403", url)
+                    return businesses
+                
+                async with self.session.get(url, headers=self.headers) as response:
+                    if response.status == 200:
+                        # Keep the body as bytes; only small captured spans are decoded later
+                        html = await response.read()
+                        logging.info(f"Successfully fetched {len(html)} bytes of HTML from JustDial")
+                        
+                        # Parse actual HTML content
+                        businesses = self._parse_real_html(html, category, location)
+                        
+                    elif response.status == 403:
+                        logging.warning("JustDial blocked the request (403)")
+                        mark_blocked(url)
+                        
+                    else:
+                        logging.warning(f"JustDial returned status {response.status} for URL: {url}")
         
         except Exception as e:
             logging.error(f"Error fetching real data from JustDial: {e}")
-            # Fallback approach
-            businesses = await self._fallback_scraping(location, category)
         
         return businesses
     
-    def _parse_real_html(self, html: str, category: str, location: str) -> List[Dict[str, Any]]:
-        """Parse actual HTML content from JustDial."""
+    def _parse_real_html(self, html: bytes, category: str, location: str) -> List[Dict[str, Any]]:
+        """Parse actual HTML content (raw response bytes) from JustDial."""
         businesses = []
         
         try:
@@ -207,15 +382,28 @@ class ActualJustDialScraper:
                 logging.warning("Received minimal HTML content from JustDial")
                 return businesses
             
+            # Block and CAPTCHA pages carry neither embedded listing JSON nor result
+            # cards; plain substring checks reject them without building a DOM
+            has_json = any(anchor in html for anchor in JSON_DATA_ANCHORS)
+            has_resultbox = RESULTBOX_MARKER in html
+            if not has_json and not has_resultbox:
+                logging.warning("No listing markers in JustDial HTML - page may be blocked")
+                return businesses
+            
             logging.info("Parsing real HTML content from JustDial")
             
             # JustDial now embeds business data in JSON within JavaScript
-            businesses = self._extract_json_data(html, category, location)
+            if has_json:
+                businesses = self._extract_json_data(html, category, location)
             
             if businesses:
                 logging.info(f"Successfully extracted {len(businesses)} businesses from JustDial JSON data")
                 return businesses
             
+            if not has_resultbox:
+                logging.warning("No .resultbox elements found - JustDial structure may have changed")
+                return businesses
+            
             # Fallback to HTML parsing if JSON extraction fails
             parser = HTMLParser(html)
             
@@ -225,15 +413,16 @@ class ActualJustDialScraper:
             if business_elements:
                 logging.info(f"Found {len(business_elements)} business elements using .resultbox selector")
                 
-                # Extract business information from each element
+                # Extract business information from each element, stamping them all alike
+                scraped_at = datetime.now().isoformat()
                 for i, element in enumerate(business_elements[:15]):  # Limit to first 15
                     try:
-                        business = self._extract_business_from_resultbox(element, category, location)
+                        business = self._extract_business_from_resultbox(element, category, location, scraped_at)
                         if business:
                             businesses.append(business)
-                            logging.debug(f"Extracted business {i+1}: {business.get('business_name', 'Unknown')}")
+                            logging.debug("Extracted business %s: %s", i+1, business.get('business_name', 'Unknown'))
                     except Exception as e:
-                        logging.debug(f"Error extracting business from element {i+1}: {e}")
+                        logging.debug("Error extracting business from element %s: %s", i+1, e)
                         continue
             else:
                 logging.warning("No .resultbox elements found - JustDial structure may have changed")
@@ -245,51 +434,44 @@ class ActualJustDialScraper:
         
         return businesses
     
-    def _extract_json_data(self, html: str, category: str, location: str) -> List[Dict[str, Any]]:
+    def _extract_json_data(self, html: bytes, category: str, location: str) -> List[Dict[str, Any]]:
         """Extract business data from embedded JSON in JustDial HTML."""
         businesses = []
         
         try:
-            import json
-            import re
-            
             # Look for JSON data patterns in JustDial
             # JustDial embeds business data in __NEXT_DATA__ or similar JSON structures
-            json_patterns = [
-                r'__NEXT_DATA__["\']?\s*=\s*({.+?})\s*;',
-                r'window\.__INITIAL_STATE__\s*=\s*({.+?})\s*;',
-                r'"results":\s*(\[.+?\])',
-                r'"businesses":\s*(\[.+?\])',
-                r'"docid":\s*"([^"]+)"',
-                r'"compname":\s*"([^"]+)"'
-            ]
-            
-            for pattern in json_patterns:
-                matches = re.findall(pattern, html, re.DOTALL)
+            for anchor, pattern in JSON_DATA_PATTERNS:
+                # A substring check is far cheaper than a DOTALL lazy scan that cannot match
+                if anchor not in html:
+                    continue
+                
+                matches = pattern.findall(html)
                 if matches:
                     logging.info(f"Found {len(matches)} JSON matches with pattern")
                     
                     for match in matches[:10]:  # Process first 10 matches
                         try:
-                            if pattern.endswith('"}'):  # Individual field matches
+                            if pattern.pattern.endswith(b'"}'):  # Individual field matches
                                 # This is for individual docid/compname fields
                                 continue
                             
                             # Try to parse as JSON
-                            if isinstance(match, str) and (match.startswith('{') or match.startswith('[')):
-                                data = json.loads(match)
+                            if isinstance(match, bytes) and match[:1] in (b'{', b'['):
+                                data = json_loads(match)
                                 extracted = self._process_json_data(data, category, location)
                                 businesses.extend(extracted)
                                 
                         except (json.JSONDecodeError, Exception) as e:
-                            logging.debug(f"Failed to parse JSON match: {e}")
+                            logging.debug("Failed to parse JSON match: %s", e)
                             continue
                     
                     if businesses:
                         break
             
             # If no structured JSON found, try to extract individual business fields
-            if not businesses:
+            # (these are keyed on compname, so skip the scan when it never appears)
+            if not businesses and b'"compname":' in html:
                 businesses = self._extract_individual_fields(html, category, location)
             
             logging.info(f"Extracted {len(businesses)} businesses from JSON data")
@@ -306,22 +488,24 @@ class ActualJustDialScraper:
         try:
             # Handle different JSON structures
             if isinstance(data, dict):
-                # Look for business arrays in various locations
+                # Look for business arrays in various locations, walking the tree
+                # depth-first with an explicit stack of (key, value) iterators
                 business_arrays = []
+                stack = [iter(data.items())]
                 
-                def find_business_arrays(obj, path=""):
-                    if isinstance(obj, dict):
-                        for key, value in obj.items():
-                            if key in ['results', 'businesses', 'listings', 'data'] and isinstance(value, list):
-                                business_arrays.append(value)
-                            elif isinstance(value, (dict, list)):
-                                find_business_arrays(value, f"{path}.{key}")
-                    elif isinstance(obj, list):
-                        for i, item in enumerate(obj):
-                            if isinstance(item, dict):
-                                find_business_arrays(item, f"{path}[{i}]")
-                
-                find_business_arrays(data)
+                while stack:
+                    entry = next(stack[-1], None)
+                    if entry is None:
+                        stack.pop()
+                        continue
+                    
+                    key, value = entry
+                    if key in BUSINESS_ARRAY_KEYS and isinstance(value, list):
+                        business_arrays.append(value)
+                    elif isinstance(value, dict):
+                        stack.append(iter(value.items()))
+                    elif isinstance(value, list):
+                        stack.append((None, item) for item in value if isinstance(item, dict))
                 
                 # Process found business arrays
                 for business_array in business_arrays:
@@ -387,36 +571,25 @@ class ActualJustDialScraper:
             return business
             
         except Exception as e:
-            logging.debug(f"Error extracting business from JSON item: {e}")
+            logging.debug("Error extracting business from JSON item: %s", e)
             return None
     
     def _extract_phone_from_json(self, item: dict) -> str:
         """Extract phone number from JSON data."""
-        phone_fields = ['mobile', 'phone', 'contact', 'telephone', 'mob', 'phoneNumber']
-        
-        for field in phone_fields:
-            phone = item.get(field, "")
-            if phone and str(phone).strip():
-                # Clean and validate phone
-                clean_phone = re.sub(r'[^\d+]', '', str(phone))
-                if len(clean_phone) >= 10:
-                    return clean_phone
-        
-        return ""
+        # One search over the joined fields; '|' is not a separator, so digits
+        # from neighbouring fields can never run together into one number
+        blob = '|'.join(str(item[field]) for field in _PHONE_FIELDS if item.get(field))
+        match = _PHONE_CANDIDATE.search(blob)
+        return clean_phone(match.group(0)) if match else ""
     
-    def _extract_individual_fields(self, html: str, category: str, location: str) -> List[Dict[str, Any]]:
+    def _extract_individual_fields(self, html: bytes, category: str, location: str) -> List[Dict[str, Any]]:
         """Extract individual business fields from HTML when structured JSON isn't available."""
         businesses = []
         
         try:
-            import re
-            
-            # Extract individual company names and doc IDs
-            compname_pattern = r'"compname":\s*"([^"]+)"'
-            docid_pattern = r'"docid":\s*"([^"]+)"'
-            
-            compnames = re.findall(compname_pattern, html)
-            docids = re.findall(docid_pattern, html)
+            # Extract individual company names and doc IDs, decoding only the captured names
+            compnames = [name.decode('utf-8', errors='replace') for name in COMPNAME_PATTERN.findall(html)]
+            docids = DOCID_PATTERN.findall(html)
             
             logging.info(f"Found {len(compnames)} company names and {len(docids)} doc IDs")
             
@@ -439,29 +612,22 @@ class ActualJustDialScraper:
         
         return businesses
     
-    def _extract_business_from_resultbox(self, element, category: str, location: str) -> Optional[Dict[str, Any]]:
+    def _extract_business_from_resultbox(self, element, category: str, location: str, scraped_at: str) -> Optional[Dict[str, Any]]:
         """Extract business information from a JustDial .resultbox element."""
         try:
             # Get all text content from the element for analysis
-            element_text = element.text() if element.text() else ""
+            element_text = element.text() or ""
             
             # Extract business name - JustDial has specific patterns
             business_name = ""
             
             # Try specific JustDial name selectors
-            name_selectors = [
-                '.fn', '.lng_cont_name', '.store-name', 
-                'h3', 'h4', '.title', '[class*="name"]',
-                'a[class*="name"]', '.business-name'
-            ]
-            
-            for selector in name_selectors:
-                name_elem = element.css_first(selector)
-                if name_elem and name_elem.text():
-                    candidate_name = name_elem.text().strip()
+            for name_elem in first_per_selector(element, NAME_SELECTORS):
+                name_text = name_elem.text()
+                if name_text:
+                    candidate_name = name_text.strip()
                     # Filter out navigation/UI text
-                    if (len(candidate_name) > 3 and 
-                        not any(skip in candidate_name.lower() for skip in ['more', 'rating', 'reviews', 'call', 'view'])):
+                    if len(candidate_name) > 3 and not SKIP_NAME_PATTERN.search(candidate_name):
                         business_name = candidate_name
                         break
             
@@ -471,8 +637,7 @@ class ActualJustDialScraper:
                 lines = element_text.split('\n')
                 for line in lines[:3]:  # Check first few lines
                     line = line.strip()
-                    if (len(line) > 3 and len(line) < 80 and 
-                        not any(skip in line.lower() for skip in ['rating', 'reviews', 'more', 'call', 'book', 'view'])):
+                    if 3 < len(line) < 80 and not SKIP_LINE_PATTERN.search(line):
                         business_name = line
                         break
             
@@ -481,30 +646,18 @@ class ActualJustDialScraper:
             
             # Extract contact information using regex on the full text
             contact = ""
-            phone_patterns = [
-                r'(\+91[-\s]?)?[6-9]\d{9}',
-                r'\b\d{3}[-\s]?\d{3}[-\s]?\d{4}\b',
-                r'\b\d{10}\b'
-            ]
-            
-            for pattern in phone_patterns:
-                phone_match = re.search(pattern, element_text)
+            for pattern in PHONE_PATTERNS:
+                phone_match = pattern.search(element_text)
                 if phone_match:
                     contact = phone_match.group(0).strip()
                     break
             
             # Extract address - look for location-related text
             address = ""
-            address_selectors = [
-                '.address', '.adr', '.location', '.addr',
-                '[class*="address"]', '[class*="location"]',
-                '.store-address', '.business-address'
-            ]
-            
-            for selector in address_selectors:
-                addr_elem = element.css_first(selector)
-                if addr_elem and addr_elem.text():
-                    addr_text = addr_elem.text().strip()
+            for addr_elem in first_per_selector(element, ADDRESS_SELECTORS):
+                addr_text = addr_elem.text()
+                if addr_text:
+                    addr_text = addr_text.strip()
                     if len(addr_text) > 10:
                         address = addr_text
                         break
@@ -522,9 +675,7 @@ class ActualJustDialScraper:
             
             # Extract website if available
             website = ""
-            website_selectors = ['a[href*="http"]', '.website', '[class*="website"]']
-            for selector in website_selectors:
-                web_elem = element.css_first(selector)
+            for web_elem in first_per_selector(element, WEBSITE_SELECTORS):
                 if web_elem:
                     href = web_elem.attributes.get('href', '')
                     if href and 'http' in href and 'justdial' not in href.lower():
@@ -540,7 +691,7 @@ class ActualJustDialScraper:
                 'category': category,
                 'location': location,
                 'source': 'JustDial (Real)',
-                'scraped_at': datetime.now().isoformat(),
+                'scraped_at': scraped_at,
                 'data_type': 'REAL_SCRAPED_DATA',
                 'extraction_method': 'HTML_PARSING'
             }
@@ -548,7 +699,7 @@ class ActualJustDialScraper:
             return business
             
         except Exception as e:
-            logging.debug(f"Error extracting business info: {e}")
+            logging.debug("Error extracting business info: %s", e)
             return None
     
     async def _fallback_scraping(self, location: str, category: str) -> List[Dict[str, Any]]:
@@ -562,13 +713,22 @@ class ActualJustDialScraper:
             mobile_url = f"https://m.justdial.com/search-{quote_plus(category)}-{quote_plus(location)}"
             
             try:
-                async with self.session.get(mobile_url) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        businesses = self._parse_real_html(html, category, location)
-                        if businesses:
-                            logging.info(f"Fallback method successful, found {len(businesses)} businesses")
-                            return businesses
+                if host_blocked(mobile_url):
+                    return businesses
+                
+                async with self._host_slot(mobile_url), self.rate_limiter:
+                    if host_blocked(mobile_url):
+                        return businesses
+                    
+                    async with self.session.get(mobile_url, headers=self.headers) as response:
+                        if response.status == 403:
+                            mark_blocked(mobile_url)
+                        elif response.status == 200:
+                            html = await response.read()
+                            businesses = self._parse_real_html(html, category, location)
+                            if businesses:
+                                logging.info(f"Fallback method successful, found {len(businesses)} businesses")
+                                return businesses
             except:
                 pass
             
@@ -579,40 +739,33 @@ class ActualJustDialScraper:
             logging.error(f"Error in fallback scraping: {e}")
         
         return businesses
-    
-    def _remove_duplicates(self, businesses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicate businesses."""
-        unique_businesses = []
-        seen_names = set()
-        
-        for business in businesses:
-            name = business.get('business_name', '').lower().strip()
-            if name and name not in seen_names:
-                seen_names.add(name)
-                unique_businesses.append(business)
-        
-        return unique_businesses
 
 
 class ActualYellowPagesScraper:
     """Actual Yellow Pages scraper that makes real HTTP requests."""
     
-    def __init__(self, utils):
+    def __init__(self, utils, rate_limiter: Optional[AsyncTokenBucket] = None):
         self.utils = utils
+        self.rate_limiter = rate_limiter or create_rate_limiter()
         self.base_url = "https://www.yellowpages.in"
         self.session = None
+        self._owns_session = True
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+    
+    def use_session(self, session: Optional[aiohttp.ClientSession]):
+        """Borrow a caller-owned session instead of opening one per search."""
+        self.session = session
+        self._owns_session = session is None
     
     async def init_session(self):
         """Initialize session for real requests."""
+        if not self._owns_session:
+            return True
+        
         try:
-            connector = aiohttp.TCPConnector(limit=5, ssl=ssl.create_default_context())
-            self.session = aiohttp.ClientSession(
-                connector=connector,
-                timeout=aiohttp.ClientTimeout(total=20),
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-            )
+            self.session = create_shared_session()
             return True
         except Exception as e:
             logging.error(f"Failed to initialize Yellow Pages session: {e}")
@@ -620,7 +773,7 @@ class ActualYellowPagesScraper:
     
     async def close_session(self):
         """Close session."""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
     
     async def search_businesses(self, location: str, category: str = "", max_results: int = 10) -> List[Dict[str, Any]]:
@@ -637,11 +790,19 @@ class ActualYellowPagesScraper:
             search_term = category or "business"
             search_url = f"{self.base_url}/search?what={quote_plus(search_term)}&where={quote_plus(location)}"
             
-            async with self.session.get(search_url) as response:
+            if host_blocked(search_url):
+                logging.info("Skipping Yellow Pages - host recently answered 403")
+                return businesses
+            
+            async with self.rate_limiter, self.session.get(search_url, headers=self.headers) as response:
                 if response.status == 200:
-                    html = await response.text()
-                    logging.info(f"Successfully fetched real Yellow Pages data: {len(html)} characters")
+                    # Hand lexbor the raw bytes; it detects the encoding itself
+                    html = await response.read()
+                    logging.info(f"Successfully fetched real Yellow Pages data: {len(html)} bytes")
                     businesses = self._parse_yellow_pages_html(html, category, location)
+                elif response.status == 403:
+                    logging.warning("Yellow Pages blocked the request (403)")
+                    mark_blocked(search_url)
                 else:
                     logging.warning(f"Yellow Pages returned status {response.status}")
         
@@ -654,7 +815,7 @@ class ActualYellowPagesScraper:
         logging.info(f"Yellow Pages real scraping found {len(businesses)} businesses")
         return businesses
     
-    def _parse_yellow_pages_html(self, html: str, category: str, location: str) -> List[Dict[str, Any]]:
+    def _parse_yellow_pages_html(self, html: bytes, category: str, location: str) -> List[Dict[str, Any]]:
         """Parse actual Yellow Pages HTML."""
         businesses = []
         
@@ -663,48 +824,41 @@ class ActualYellowPagesScraper:
             
             # Look for business listings
             business_elements = parser.css('.listing, .result, .business-info, .srp-list-item')
+            scraped_at = datetime.now().isoformat()
             
             for element in business_elements[:10]:
                 try:
                     # Extract name
-                    name_elem = element.css_first('.business-name, .name, h3, h4, .title')
-                    if not name_elem or not name_elem.text():
+                    business_name = first_text(element, '.business-name, .name, h3, h4, .title')
+                    if not business_name:
                         continue
                     
-                    business_name = name_elem.text().strip()
-                    
                     # Extract contact
                     contact = ""
                     contact_elem = element.css_first('.phone, .contact, [href^="tel:"]')
                     if contact_elem:
                         contact_text = contact_elem.text() or contact_elem.attributes.get('href', '') or ""
                         if contact_text:
-                            phone_match = re.search(r'(\+91[-\s]?)?[6-9]\d{9}', contact_text)
+                            phone_match = MOBILE_PATTERN.search(contact_text)
                             if phone_match:
                                 contact = phone_match.group(0)
                     
-                    # Extract address
-                    address = ""
-                    addr_elem = element.css_first('.address, .location, .addr')
-                    if addr_elem:
-                        address = addr_elem.text().strip()
-                    
                     business = {
                         'business_name': business_name,
                         'contact': contact,
-                        'address': address or location,
+                        'address': first_text(element, '.address, .location, .addr') or location,
                         'website': "",
                         'category': category,
                         'location': location,
                         'source': 'Yellow Pages (Real)',
-                        'scraped_at': datetime.now().isoformat(),
+                        'scraped_at': scraped_at,
                         'data_type': 'REAL_SCRAPED_DATA'
                     }
                     
                     businesses.append(business)
                 
                 except Exception as e:
-                    logging.debug(f"Error extracting Yellow Pages business: {e}")
+                    logging.debug("Error extracting Yellow Pages business: %s", e)
                     continue
         
         except Exception as e:
@@ -716,11 +870,88 @@ class ActualYellowPagesScraper:
 class RealGoogleMapsAPIScraper:
     """Google Maps API scraper for high-quality real data."""
     
-    def __init__(self, utils, api_key: Optional[str] = None):
+    # How long cached Places responses stay fresh, in seconds
+    text_search_max_age = 24 * 60 * 60
+    details_max_age = 7 * 24 * 60 * 60
+    
+    # Upper bound on Place Details requests in flight at once
+    max_concurrent_details = 10
+    
+    # The Places API has its own quota, so it is paced apart from the scraping limiter
+    api_requests_per_minute = 600
+    api_burst_limit = 20
+    
+    # Transient HTTP statuses retried with exponential backoff, and the backoff ceiling
+    retry_statuses = frozenset((429, 500, 502, 503, 504))
+    max_retries = 3
+    max_retry_delay = 20
+    
+    def __init__(self, utils, api_key: Optional[str] = None, rate_limiter: Optional[AsyncTokenBucket] = None,
+                 cache=None, force_refresh: bool = False):
         self.utils = utils
+        self.rate_limiter = rate_limiter or create_rate_limiter(
+            self.api_requests_per_minute, self.api_burst_limit
+        )
         self.api_key = api_key or os.getenv('GOOGLE_MAPS_API_KEY')
         self.base_url = "https://maps.googleapis.com/maps/api/place"
         self.session = None
+        self._owns_session = True
+        # Optional response store (get_cached_response/cache_response, e.g. DatabaseManager)
+        self.cache = cache
+        self.force_refresh = force_refresh
+    
+    def use_session(self, session: Optional[aiohttp.ClientSession]):
+        """Borrow a caller-owned session instead of opening one per search."""
+        self.session = session
+        self._owns_session = session is None
+    
+    async def _get_places_json(self, url: str, params: Dict[str, str], max_age: float) -> Optional[Dict[str, Any]]:
+        """GET a Places endpoint, serving fresh cached responses without touching the network."""
+        # The API key is left out of the cache key so rotating it keeps the cache warm
+        cache_key = None
+        if self.cache is not None:
+            request_id = url + '?' + '&'.join(f"{k}={v}" for k, v in sorted(params.items()) if k != 'key')
+            cache_key = hashlib.sha1(request_id.encode('utf-8')).hexdigest()
+            if not self.force_refresh:
+                body = self.cache.get_cached_response(cache_key, max_age)
+                if body is not None:
+                    logging.debug("Serving cached Places response for %s", url)
+                    return json_loads(body)
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self.rate_limiter, self.session.get(url, params=params) as response:
+                    if response.status == 200:
+                        body = await response.read()
+                        break
+                    
+                    if response.status not in self.retry_statuses or attempt == self.max_retries:
+                        logging.error(f"Google API request failed with status {response.status}")
+                        return None
+                    
+                    delay = self._retry_delay(attempt, response.headers.get('Retry-After'))
+                    logging.warning("Google API returned %s, retrying in %.1fs", response.status, delay)
+            
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Connection resets and timeouts are transient too; the last one propagates
+                if attempt == self.max_retries:
+                    raise
+                delay = self._retry_delay(attempt, None)
+                logging.warning("Google API request failed (%r), retrying in %.1fs", e, delay)
+            
+            await asyncio.sleep(delay)
+        
+        data = json_loads(body)
+        # Only successful answers are cached; errors and quota failures are retried
+        if cache_key and data.get('status') == 'OK':
+            self.cache.cache_response(cache_key, body)
+        return data
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Seconds to wait before the next attempt, honouring a numeric Retry-After header."""
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.max_retry_delay)
+        return min(2 ** attempt + random.random(), self.max_retry_delay)
     
     async def search_businesses(self, location: str, category: str = "", max_results: int = 20) -> List[Dict[str, Any]]:
         """Search using actual Google Places API."""
@@ -731,7 +962,8 @@ class RealGoogleMapsAPIScraper:
             return businesses
         
         try:
-            self.session = aiohttp.ClientSession()
+            if self._owns_session:
+                self.session = create_shared_session()
             
             # Make real API call
             query = f"{category} in {location}" if category else f"businesses in {location}"
@@ -745,33 +977,41 @@ class RealGoogleMapsAPIScraper:
             
             logging.info(f"Making REAL Google Places API call for '{query}'")
             
-            async with self.session.get(search_url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
+            data = await self._get_places_json(search_url, params, self.text_search_max_age)
+            if data is not None:
+                if data.get('status') == 'OK':
+                    logging.info(f"Google API returned {len(data.get('results', []))} real businesses")
                     
-                    if data.get('status') == 'OK':
-                        logging.info(f"Google API returned {len(data.get('results', []))} real businesses")
-                        
-                        for place in data.get('results', [])[:max_results]:
-                            business = await self._get_place_details(place, category, location)
-                            if business:
-                                businesses.append(business)
-                    else:
-                        logging.warning(f"Google Places API error: {data.get('status')}")
+                    # Fetch details concurrently; the rate limiter still paces the requests
+                    semaphore = asyncio.Semaphore(self.max_concurrent_details)
+                    scraped_at = datetime.now().isoformat()
+                    
+                    async def place_details(place):
+                        async with semaphore:
+                            return await self._get_place_details(place, category, location, scraped_at)
+                    
+                    details = await asyncio.gather(
+                        *(place_details(place) for place in data.get('results', [])[:max_results]),
+                        return_exceptions=True
+                    )
+                    businesses.extend(
+                        business for business in details
+                        if business and not isinstance(business, Exception)
+                    )
                 else:
-                    logging.error(f"Google API request failed with status {response.status}")
+                    logging.warning(f"Google Places API error: {data.get('status')}")
         
         except Exception as e:
             logging.error(f"Error in real Google Places API call: {e}")
         
         finally:
-            if self.session:
+            if self.session and self._owns_session:
                 await self.session.close()
         
         logging.info(f"Google Maps API found {len(businesses)} real businesses")
         return businesses
     
-    async def _get_place_details(self, place: Dict, category: str, location: str) -> Optional[Dict[str, Any]]:
+    async def _get_place_details(self, place: Dict, category: str, location: str, scraped_at: str) -> Optional[Dict[str, Any]]:
         """Get detailed information from Google Places API."""
         try:
             place_id = place.get('place_id')
@@ -785,30 +1025,27 @@ class RealGoogleMapsAPIScraper:
                 'fields': 'name,formatted_address,formatted_phone_number,website,geometry'
             }
             
-            async with self.session.get(details_url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    if data.get('status') == 'OK':
-                        result = data.get('result', {})
-                        
-                        business = {
-                            'business_name': result.get('name', ''),
-                            'contact': result.get('formatted_phone_number', ''),
-                            'address': result.get('formatted_address', ''),
-                            'website': result.get('website', ''),
-                            'category': category,
-                            'location': location,
-                            'latitude': result.get('geometry', {}).get('location', {}).get('lat'),
-                            'longitude': result.get('geometry', {}).get('location', {}).get('lng'),
-                            'source': 'Google Maps API (Real)',
-                            'scraped_at': datetime.now().isoformat(),
-                            'data_type': 'REAL_API_DATA'
-                        }
-                        
-                        return business
+            data = await self._get_places_json(details_url, params, self.details_max_age)
+            if data is not None and data.get('status') == 'OK':
+                result = data.get('result', {})
+                
+                business = {
+                    'business_name': result.get('name', ''),
+                    'contact': result.get('formatted_phone_number', ''),
+                    'address': result.get('formatted_address', ''),
+                    'website': result.get('website', ''),
+                    'category': category,
+                    'location': location,
+                    'latitude': result.get('geometry', {}).get('location', {}).get('lat'),
+                    'longitude': result.get('geometry', {}).get('location', {}).get('lng'),
+                    'source': 'Google Maps API (Real)',
+                    'scraped_at': scraped_at,
+                    'data_type': 'REAL_API_DATA'
+                }
+                
+                return business
         
         except Exception as e:
-            logging.debug(f"Error getting place details: {e}")
+            logging.debug("Error getting place details: %s", e)
         
         return None
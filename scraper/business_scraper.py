@@ -1,8 +1,10 @@
 import asyncio
 import logging
+import time
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
-import random
+
+from config import clean_phone
 
 from .directory_scrapers import JustDialScraper, IndiaMArtScraper, YellowPagesScraper
 from .maps_scraper import GoogleMapsScraper, PlaywrightScraper
@@ -12,11 +14,30 @@ from .it_client_targeting import ITClientTargetingScraper
 class BusinessScraper:
     """Main scraper class that coordinates multiple scraping sources."""
     
+    # Upper bound on sources scraped at the same time
+    max_concurrent_sources = 10
+    
+    # Upper bound on geocoding lookups in flight at once
+    max_concurrent_geocodes = 4
+    
+    # Seconds each scraper gets in test_scrapers before it counts as failed
+    test_timeout = 30
+    
+    # Consecutive scrape errors after which a source is rested, and for how many seconds
+    max_source_failures = 3
+    source_cooldown = 300
+    
+    # Fields a duplicate from a later source may fill in on the business already kept
+    merge_fields = ('website', 'latitude', 'longitude')
+    
     def __init__(self, utils, db_manager):
         self.utils = utils
         self.db_manager = db_manager
         self.scrapers = {}
         self.session_id = None
+        # Consecutive scrape errors per source, and when a rested source may be tried again
+        self._failures = {}
+        self._retry_at = {}
         
         # Initialize scrapers
         self.init_scrapers()
@@ -67,14 +88,20 @@ class BusinessScraper:
             'businesses_by_source': {},
             'errors': [],
             'started_at': datetime.now().isoformat(),
-            'session_id': self.session_id
+            'session_id': self.session_id,
+            'deduplicated_count': 0
         }
         
         all_businesses = []
+        # Business kept for each fingerprint already taken from any source in this run
+        seen_fingerprints = {}
+        # Kept businesses that picked up fields from a later duplicate, by id()
+        merged_businesses = {}
         
         logging.info(f"Starting to scrape location: {location} with sources: {sources}")
         
-        # Scrape from each source
+        # Drop unknown sources up front so they are reported immediately
+        known_sources = []
         for source in sources:
             if source not in self.scrapers:
                 error_msg = f"Unknown scraper source: {source}"
@@ -82,36 +109,88 @@ class BusinessScraper:
                 results['errors'].append(error_msg)
                 continue
             
-            try:
+            # After the cool-down one trial scrape is let through; another error rests it again
+            if time.monotonic() < self._retry_at.get(source, 0):
+                error_msg = f"Skipping {source} after {self._failures[source]} consecutive scrape errors"
+                logging.warning(error_msg)
+                results['errors'].append(error_msg)
+                continue
+            
+            known_sources.append(source)
+        
+        # Scrape all sources concurrently; each source talks to a different host
+        semaphore = asyncio.Semaphore(self.max_concurrent_sources)
+        loop = asyncio.get_running_loop()
+        
+        async def scrape_one_source(source: str) -> List[Dict[str, Any]]:
+            async with semaphore:
                 logging.info(f"Scraping from {source}...")
                 source_businesses = await self._scrape_from_source(
                     source, location, category, max_results_per_source
                 )
                 
+                # Drop businesses another source already returned, before the costly steps
+                unique_businesses = []
+                for business in source_businesses:
+                    fingerprint = self._business_fingerprint(business)
+                    kept = seen_fingerprints.get(fingerprint) if fingerprint else None
+                    if kept is not None:
+                        # Keep the richer record by filling in only what the first source lacked
+                        for field in self.merge_fields:
+                            if kept.get(field) in (None, '') and business.get(field) not in (None, ''):
+                                kept[field] = business[field]
+                                merged_businesses[id(kept)] = kept
+                        results['deduplicated_count'] += 1
+                    else:
+                        if fingerprint:
+                            seen_fingerprints[fingerprint] = business
+                        unique_businesses.append(business)
+                source_businesses = unique_businesses
+                
                 if source_businesses:
                     # Add geocoding information
                     source_businesses = await self._add_geocoding(source_businesses)
                     
-                    # Store in database
-                    stored_count = self.db_manager.insert_businesses_batch(source_businesses)
-                    
-                    all_businesses.extend(source_businesses)
-                    results['businesses_by_source'][source] = len(source_businesses)
-                    results['sources_scraped'].append(source)
-                    
+                    # Store in database on a worker thread while other sources keep scraping
+                    stored_count = await loop.run_in_executor(
+                        None, self.db_manager.insert_businesses_batch, source_businesses
+                    )
                     logging.info(f"Scraped {len(source_businesses)} businesses from {source}, {stored_count} stored")
-                else:
-                    logging.warning(f"No businesses found from {source}")
-                    results['businesses_by_source'][source] = 0
-                
-                # Add delay between sources
-                await asyncio.sleep(random.uniform(2, 5))
                 
-            except Exception as e:
-                error_msg = f"Error scraping from {source}: {str(e)}"
+                return source_businesses
+        
+        source_results = await asyncio.gather(
+            *(scrape_one_source(source) for source in known_sources),
+            return_exceptions=True
+        )
+        
+        # Kept businesses may have been stored before a later source filled them in
+        if merged_businesses:
+            await loop.run_in_executor(
+                None, self.db_manager.fill_missing_fields, list(merged_businesses.values())
+            )
+        
+        for source, outcome in zip(known_sources, source_results):
+            if not isinstance(outcome, Exception):
+                # Any completed scrape, even an empty one, closes the breaker
+                self._failures.pop(source, None)
+                self._retry_at.pop(source, None)
+            
+            if isinstance(outcome, Exception):
+                self._failures[source] = self._failures.get(source, 0) + 1
+                if self._failures[source] >= self.max_source_failures:
+                    self._retry_at[source] = time.monotonic() + self.source_cooldown
+                error_msg = f"Error scraping from {source}: {str(outcome)}"
                 logging.error(error_msg)
                 results['errors'].append(error_msg)
                 results['businesses_by_source'][source] = 0
+            elif outcome:
+                all_businesses.extend(outcome)
+                results['businesses_by_source'][source] = len(outcome)
+                results['sources_scraped'].append(source)
+            else:
+                logging.warning(f"No businesses found from {source}")
+                results['businesses_by_source'][source] = 0
         
         # Close all scraper sessions
         await self._cleanup_scrapers(sources)
@@ -151,25 +230,46 @@ class BusinessScraper:
                 max_pages = max(1, max_results // 20)  # Assume ~20 results per page
                 businesses = await scraper.search_businesses(location, category, max_pages)
             elif source == 'playwright':
-                # For playwright, we can scrape multiple URLs
+                # For playwright, scrape multiple URLs as parallel pages of one browser
                 business_urls = self._get_business_directory_urls(location, category)
-                for url in business_urls[:3]:  # Limit to 3 URLs
-                    url_businesses = await scraper.scrape_generic_directory(url, location)
+                if not scraper.browser:
+                    # Launch once up front so concurrent pages don't each start a browser
+                    await scraper.init_browser()
+                url_results = await asyncio.gather(
+                    *(scraper.scrape_generic_directory(url, location) for url in business_urls[:3])  # Limit to 3 URLs
+                )
+                for url_businesses in url_results:
                     businesses.extend(url_businesses)
-                    await asyncio.sleep(random.uniform(3, 6))
             
-            # Add location and category info to all businesses
+            # Add location and category info to all businesses, stamped with one timestamp
+            scraped_at = datetime.now().isoformat()
             for business in businesses:
                 business['location'] = location
                 if category:
                     business['category'] = category
-                business['scraped_at'] = datetime.now().isoformat()
+                business['scraped_at'] = scraped_at
             
             return businesses
             
         except Exception as e:
             logging.error(f"Error in _scrape_from_source for {source}: {e}")
-            return []
+            raise
+    
+    @staticmethod
+    def _business_fingerprint(business: Dict[str, Any]) -> Optional[tuple]:
+        """Identify a business across sources by normalized name plus phone digits, or address.
+        
+        Without a phone the address tells chain branches apart; with neither there is
+        nothing safe to match on and None is returned.
+        """
+        name = ' '.join((business.get('business_name') or '').casefold().split())
+        phone = clean_phone(business.get('contact') or '')
+        if phone:
+            return name, 'phone', phone
+        address = ' '.join((business.get('address') or '').casefold().split())
+        if address:
+            return name, 'address', address
+        return None
     
     def _get_business_directory_urls(self, location: str, category: str) -> List[str]:
         """Get URLs for business directories to scrape with Playwright."""
@@ -195,19 +295,28 @@ class BusinessScraper:
     
     async def _add_geocoding(self, businesses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Add latitude and longitude to businesses."""
+        # Each distinct address is looked up once, off the event loop; cache hits return at
+        # once while ScrapingUtils paces the actual Nominatim requests to one per second
+        addresses = {business['address'] for business in businesses if business.get('address')}
+        semaphore = asyncio.Semaphore(self.max_concurrent_geocodes)
+        loop = asyncio.get_running_loop()
+        
+        async def geocode(address: str):
+            async with semaphore:
+                return await loop.run_in_executor(None, self.utils.geocode_address, address)
+        
+        addresses = list(addresses)
+        lookups = await asyncio.gather(*(geocode(address) for address in addresses), return_exceptions=True)
+        coordinates = dict(zip(addresses, lookups))
+        
         for business in businesses:
             if business.get('address'):
-                try:
-                    coords = self.utils.geocode_address(business['address'])
-                    if coords:
-                        business['latitude'] = coords['latitude']
-                        business['longitude'] = coords['longitude']
-                    
-                    # Add small delay to respect geocoding service limits
-                    await asyncio.sleep(0.1)
-                    
-                except Exception as e:
-                    logging.warning(f"Geocoding failed for {business.get('business_name', 'Unknown')}: {e}")
+                coords = coordinates[business['address']]
+                if isinstance(coords, Exception):
+                    logging.warning(f"Geocoding failed for {business.get('business_name', 'Unknown')}: {coords}")
+                elif coords:
+                    business['latitude'] = coords['latitude']
+                    business['longitude'] = coords['longitude']
         
         return businesses
     
@@ -266,29 +375,39 @@ class BusinessScraper:
     async def test_scrapers(self) -> Dict[str, bool]:
         """Test all scrapers to check if they're working."""
         test_location = "Mumbai"
-        test_results = {}
         
-        for source_name, scraper in self.scrapers.items():
-            try:
-                if source_name == 'googlemaps':
-                    await scraper.init_browser(headless=True)
-                    results = await scraper.search_businesses(test_location, max_results=1)
+        async def run_test(source_name: str, scraper) -> List[Dict[str, Any]]:
+            if source_name == 'googlemaps':
+                await scraper.init_browser(headless=True)
+                try:
+                    return await scraper.search_businesses(test_location, max_results=1)
+                finally:
                     await scraper.close_browser()
-                elif source_name in ['justdial', 'indiamart', 'yellowpages', 'it_clients']:
-                    results = await scraper.search_businesses(test_location, max_pages=1)
-                elif source_name == 'playwright':
-                    await scraper.init_browser(headless=True)
+            elif source_name in ['justdial', 'indiamart', 'yellowpages', 'it_clients']:
+                return await scraper.search_businesses(test_location, max_pages=1)
+            elif source_name == 'playwright':
+                await scraper.init_browser(headless=True)
+                try:
                     test_url = f"https://www.justdial.com/{test_location}"
-                    results = await scraper.scrape_generic_directory(test_url, test_location)
+                    return await scraper.scrape_generic_directory(test_url, test_location)
+                finally:
                     await scraper.close_browser()
-                else:
-                    results = []
-                
-                test_results[source_name] = len(results) > 0
-                logging.info(f"Test for {source_name}: {'PASSED' if test_results[source_name] else 'FAILED'}")
-                
-            except Exception as e:
+            return []
+        
+        # Tests are independent, so run them together; a hung scraper only fails itself
+        names = list(self.scrapers)
+        outcomes = await asyncio.gather(
+            *(asyncio.wait_for(run_test(name, self.scrapers[name]), self.test_timeout) for name in names),
+            return_exceptions=True
+        )
+        
+        test_results = {}
+        for source_name, outcome in zip(names, outcomes):
+            if isinstance(outcome, BaseException):
                 test_results[source_name] = False
-                logging.error(f"Test for {source_name} failed: {e}")
+                logging.error(f"Test for {source_name} failed: {outcome!r}")
+            else:
+                test_results[source_name] = len(outcome) > 0
+                logging.info(f"Test for {source_name}: {'PASSED' if test_results[source_name] else 'FAILED'}")
         
         return test_results
@@ -2,10 +2,12 @@ import asyncio
 import logging
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
-import random
 import os
 
-from .actual_real_scrapers import ActualJustDialScraper, ActualYellowPagesScraper, RealGoogleMapsAPIScraper
+from .actual_real_scrapers import (
+    ActualJustDialScraper, ActualYellowPagesScraper, RealGoogleMapsAPIScraper,
+    create_rate_limiter, create_shared_session
+)
 from .maps_scraper import PlaywrightScraper  # Browser-based scraper (real data only)
 # Removed ITClientTargetingScraper - generates demo data
 
@@ -13,9 +15,13 @@ from .maps_scraper import PlaywrightScraper  # Browser-based scraper (real data
 class RealBusinessScraper:
     """Business scraper that fetches real data from actual websites."""
     
-    def __init__(self, utils, db_manager):
+    # Upper bound on sources scraped at the same time
+    max_concurrent_sources = 10
+    
+    def __init__(self, utils, db_manager, rate_limiter=None):
         self.utils = utils
         self.db_manager = db_manager
+        self.rate_limiter = rate_limiter or create_rate_limiter()
         self.scrapers = {}
         self.session_id = None
         
@@ -26,9 +32,9 @@ class RealBusinessScraper:
         """Initialize all REAL scraper instances - NO DEMO DATA."""
         try:
             self.scrapers = {
-                'justdial_real': ActualJustDialScraper(self.utils),
-                'google_maps_api': RealGoogleMapsAPIScraper(self.utils),
-                'yellowpages_real': ActualYellowPagesScraper(self.utils),
+                'justdial_real': ActualJustDialScraper(self.utils, rate_limiter=self.rate_limiter),
+                'google_maps_api': RealGoogleMapsAPIScraper(self.utils, cache=self.db_manager),
+                'yellowpages_real': ActualYellowPagesScraper(self.utils, rate_limiter=self.rate_limiter),
                 'playwright': PlaywrightScraper(self.utils)  # Browser-based scraper (real data only)
                 # Removed 'it_clients': ITClientTargetingScraper - generates demo data
             }
@@ -95,9 +101,9 @@ class RealBusinessScraper:
         
         logging.info(f"Starting REAL data scraping for location: {location} with sources: {sources}")
         
-        # Scrape from each source
+        # Resolve source names up front so unknown sources are reported immediately
+        known_sources = []
         for source in sources:
-            # Resolve source name (e.g., 'justdial' -> 'justdial_real')
             resolved_source = self._resolve_source_name(source)
             
             if resolved_source not in self.scrapers:
@@ -106,46 +112,46 @@ class RealBusinessScraper:
                 results['errors'].append(error_msg)
                 continue
             
+            known_sources.append(source)
+        
+        # Scrape all sources concurrently; each source talks to a different host
+        semaphore = asyncio.Semaphore(self.max_concurrent_sources)
+        
+        async def scrape_with_limit(source: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.scrape_one_source(
+                    source, location, category, max_results_per_source
+                )
+        
+        # One pooled HTTP session for the whole run so connections are reused across sources
+        async with create_shared_session() as session:
+            self._attach_session(session)
             try:
-                logging.info(f"Scraping REAL data from {source} (using {resolved_source})...")
-                source_businesses = await self._scrape_from_source(
-                    resolved_source, location, category, max_results_per_source
+                source_results = await asyncio.gather(
+                    *(scrape_with_limit(source) for source in known_sources),
+                    return_exceptions=True
                 )
-                
-                if source_businesses:
-                    # Validate and clean data
-                    validated_businesses = self._validate_and_clean_businesses(source_businesses)
-                    
-                    if validated_businesses:
-                        # Add geocoding information if not present
-                        geocoded_businesses = await self._add_geocoding_if_needed(validated_businesses)
-                        
-                        # Store in database
-                        stored_count = self.db_manager.insert_businesses_batch(geocoded_businesses)
-                        
-                        all_businesses.extend(geocoded_businesses)
-                        results['businesses_by_source'][source] = len(geocoded_businesses)  # Use original source name
-                        results['sources_scraped'].append(source)  # Use original source name
-                        
-                        logging.info(f"Scraped {len(geocoded_businesses)} REAL businesses from {source} (via {resolved_source}), {stored_count} stored")
-                    else:
-                        logging.warning(f"No valid businesses found from {source}")
-                        results['businesses_by_source'][source] = 0
-                else:
-                    logging.warning(f"No businesses found from {source}")
-                    results['businesses_by_source'][source] = 0
-                
-                # Add delay between sources to be respectful
-                await asyncio.sleep(random.uniform(3, 6))
-                
-            except Exception as e:
-                error_msg = f"Error scraping from {source}: {str(e)}"
+            finally:
+                self._attach_session(None)
+        
+        for source, outcome in zip(known_sources, source_results):
+            if isinstance(outcome, Exception):
+                error_msg = f"Error scraping from {source}: {str(outcome)}"
                 logging.error(error_msg)
                 results['errors'].append(error_msg)
                 results['businesses_by_source'][source] = 0
+            elif outcome:
+                all_businesses.extend(outcome)
+                results['businesses_by_source'][source] = len(outcome)  # Use original source name
+                results['sources_scraped'].append(source)  # Use original source name
+            else:
+                results['businesses_by_source'][source] = 0
         
-        # Remove duplicates across all sources
+        # Remove duplicates across all sources, then store the whole run in one transaction
         unique_businesses = self._remove_cross_source_duplicates(all_businesses)
+        if unique_businesses:
+            stored_count = self.db_manager.insert_businesses_batch(unique_businesses)
+            logging.info(f"Stored {stored_count} of {len(unique_businesses)} unique scraped businesses")
         
         # Update final results
         results['total_businesses'] = len(unique_businesses)
@@ -169,6 +175,42 @@ class RealBusinessScraper:
         
         return results
     
+    def _attach_session(self, session):
+        """Lend a shared HTTP session to every scraper that can use one."""
+        for scraper in self.scrapers.values():
+            if hasattr(scraper, 'use_session'):
+                scraper.use_session(session)
+    
+    async def scrape_one_source(self,
+                                source: str,
+                                location: str,
+                                category: str,
+                                max_results: int) -> List[Dict[str, Any]]:
+        """Scrape, validate and geocode businesses from a single source."""
+        resolved_source = self._resolve_source_name(source)
+        
+        logging.info(f"Scraping REAL data from {source} (using {resolved_source})...")
+        source_businesses = await self._scrape_from_source(
+            resolved_source, location, category, max_results
+        )
+        
+        if not source_businesses:
+            logging.warning(f"No businesses found from {source}")
+            return []
+        
+        # Validate and clean data
+        validated_businesses = self._validate_and_clean_businesses(source_businesses)
+        
+        if not validated_businesses:
+            logging.warning(f"No valid businesses found from {source}")
+            return []
+        
+        # Add geocoding information if not present
+        geocoded_businesses = await self._add_geocoding_if_needed(validated_businesses)
+        
+        logging.info(f"Scraped {len(geocoded_businesses)} REAL businesses from {source} (via {resolved_source})")
+        return geocoded_businesses
+    
     async def _scrape_from_source(self, 
                                 source: str, 
                                 location: str, 
@@ -203,6 +245,7 @@ class RealBusinessScraper:
     def _validate_and_clean_businesses(self, businesses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Validate and clean business data to ensure quality."""
         validated_businesses = []
+        validated_at = datetime.now().isoformat()
         
         for business in businesses:
             try:
@@ -249,14 +292,14 @@ class RealBusinessScraper:
                 
                 # Mark as real data
                 business['data_type'] = 'REAL_DATA'
-                business['validated_at'] = datetime.now().isoformat()
+                business['validated_at'] = validated_at
                 
                 # Final validation check
                 if self.utils.is_valid_business_data(business):
                     validated_businesses.append(business)
                 
             except Exception as e:
-                logging.debug(f"Error validating business data: {e}")
+                logging.debug("Error validating business data: %s", e)
                 continue
         
         logging.info(f"Validated {len(validated_businesses)} out of {len(businesses)} businesses")
@@ -278,7 +321,7 @@ class RealBusinessScraper:
                             business['latitude'] = coordinates.get('latitude')
                             business['longitude'] = coordinates.get('longitude')
                 except Exception as e:
-                    logging.debug(f"Error geocoding business: {e}")
+                    logging.debug("Error geocoding business: %s", e)
             
             geocoded_businesses.append(business)
         
@@ -346,7 +389,7 @@ class RealBusinessScraper:
                     if hasattr(scraper, 'close_session'):
                         await scraper.close_session()
                 except Exception as e:
-                    logging.debug(f"Error cleaning up {source}: {e}")
+                    logging.debug("Error cleaning up %s: %s", source, e)
     
     async def quick_scrape(self, location: str, category: str = "", selected_sources: Optional[List[str]] = None) -> Dict[str, Any]:
         """Quick scrape with real data only - fewer results, faster execution."""
@@ -9,6 +9,8 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 import time
 
+from .actual_real_scrapers import create_shared_session
+
 class StreamlitRealScraper:
     """Real scraper for Streamlit that only returns actual business data."""
     
@@ -36,7 +38,7 @@ class StreamlitRealScraper:
                 'justdial_real': ActualJustDialScraper(self.utils),
                 'yellowpages_real': ActualYellowPagesScraper(self.utils),  
                 'googlemaps_real': GoogleMapsScraper(self.utils),
-                'googlemaps_api': RealGoogleMapsAPIScraper(self.utils)
+                'googlemaps_api': RealGoogleMapsAPIScraper(self.utils, cache=self.db_manager)
             }
             logging.info("Real scrapers initialized successfully - NO DEMO DATA")
         except Exception as e:
@@ -81,42 +83,48 @@ class StreamlitRealScraper:
         
         logging.info(f"Starting REAL data scraping for: {location} with sources: {available_sources}")
         
-        # Scrape from each real source
-        for source in available_sources:
-            if source not in self.real_scrapers:
-                continue
-            
+        # Scrape from each real source over one pooled HTTP session for the whole run
+        async with create_shared_session() as http_session:
+            self._attach_session(http_session)
             try:
-                logging.info(f"Scraping REAL data from {source}...")
-                source_businesses = await self._scrape_from_real_source(
-                    source, location, category, max_results_per_source
-                )
-                
-                if source_businesses:
-                    # Ensure all data is marked as real
-                    for business in source_businesses:
-                        business['data_type'] = 'REAL_DATA'
-                        business['scraped_at'] = datetime.now().isoformat()
+                for source in available_sources:
+                    if source not in self.real_scrapers:
+                        continue
                     
-                    # Store in database
-                    stored_count = self.db_manager.insert_businesses_batch(source_businesses)
+                    try:
+                        logging.info(f"Scraping REAL data from {source}...")
+                        source_businesses = await self._scrape_from_real_source(
+                            source, location, category, max_results_per_source
+                        )
+                        
+                        if source_businesses:
+                            # Ensure all data is marked as real
+                            scraped_at = datetime.now().isoformat()
+                            for business in source_businesses:
+                                business['data_type'] = 'REAL_DATA'
+                                business['scraped_at'] = scraped_at
+                            
+                            # Store in database
+                            stored_count = self.db_manager.insert_businesses_batch(source_businesses)
+                            
+                            all_businesses.extend(source_businesses)
+                            results['businesses_by_source'][source] = len(source_businesses)
+                            results['sources_scraped'].append(source)
+                            
+                            logging.info(f"Found {len(source_businesses)} REAL businesses from {source}")
+                        else:
+                            logging.warning(f"No businesses found from {source}")
+                            
+                    except Exception as e:
+                        error_msg = f"Error scraping from {source}: {e}"
+                        logging.error(error_msg)
+                        results['errors'].append(error_msg)
+                        continue
                     
-                    all_businesses.extend(source_businesses)
-                    results['businesses_by_source'][source] = len(source_businesses)
-                    results['sources_scraped'].append(source)
-                    
-                    logging.info(f"Found {len(source_businesses)} REAL businesses from {source}")
-                else:
-                    logging.warning(f"No businesses found from {source}")
-                    
-            except Exception as e:
-                error_msg = f"Error scraping from {source}: {e}"
-                logging.error(error_msg)
-                results['errors'].append(error_msg)
-                continue
-            
-            # Rate limiting between sources
-            await asyncio.sleep(2)
+                    # Rate limiting between sources
+                    await asyncio.sleep(2)
+            finally:
+                self._attach_session(None)
         
         # Remove duplicates
         unique_businesses = self._remove_duplicates(all_businesses)
@@ -132,6 +140,12 @@ class StreamlitRealScraper:
         
         return results
     
+    def _attach_session(self, session):
+        """Lend a shared HTTP session to every scraper that can use one."""
+        for scraper in self.real_scrapers.values():
+            if hasattr(scraper, 'use_session'):
+                scraper.use_session(session)
+    
     async def _scrape_from_real_source(self, source: str, location: str, category: str, max_results: int) -> List[Dict[str, Any]]:
         """Scrape from a real data source only."""
         businesses = []
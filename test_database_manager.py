@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Test script for DatabaseManager batch inserts, search and caches against a temporary database.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from database.db_manager import DatabaseManager
+
+def make_business(i, **fields):
+    """Build one business row with a distinct name and address."""
+    business = {
+        'business_name': f"Business {i}",
+        'contact': f"98765{i:05d}",
+        'address': f"{i} Main Road",
+        'category': 'IT Services',
+        'location': 'Agra',
+        'source': 'test'
+    }
+    business.update(fields)
+    return business
+
+def test_batch_insert_across_chunks(db_path):
+    """Rows spanning several INSERT chunks are stored once, duplicates included."""
+    print("🧪 Testing batch insert across chunk boundaries...")
+    db = DatabaseManager(db_path)
+    
+    rows_per_chunk = min(db.insert_chunk_size, db.max_sql_variables // len(db.INSERT_COLUMNS))
+    total = rows_per_chunk * 2 + 5
+    businesses = [make_business(i) for i in range(total)]
+    # Repeat the first row in a later chunk
+    businesses.insert(rows_per_chunk + 1, make_business(0))
+    
+    stored = db.insert_businesses_batch(iter(businesses))
+    assert stored == total, f"expected {total} stored, got {stored}"
+    assert len(db.get_businesses()) == total
+    
+    # A second run of the same rows adds nothing
+    assert db.insert_businesses_batch(businesses) == 0
+    print(f"✅ Stored {stored} rows over {total // rows_per_chunk + 1} chunks")
+    db.close()
+
+def test_insert_after_clear_from_second_manager(db_path):
+    """A manager still inserts rows another manager cleared from the shared file."""
+    print("🧪 Testing insert after clear_all_data from a second manager...")
+    first = DatabaseManager(db_path)
+    second = DatabaseManager(db_path)
+    
+    assert first.insert_businesses_batch([make_business(1)]) == 1
+    assert second.clear_all_data() == 1
+    assert first.insert_businesses_batch([make_business(1)]) == 1
+    assert len(second.get_businesses()) == 1
+    print("✅ Cleared rows can be stored again")
+    first.close()
+    second.close()
+
+def test_search_fts_matches_like(db_path):
+    """Full-text search and the LIKE fallback return the same businesses for word prefixes."""
+    print("🧪 Testing FTS and LIKE search parity...")
+    db = DatabaseManager(db_path)
+    if not db.fts_enabled:
+        print("⚠️ FTS5 unavailable in this SQLite build, skipping")
+        db.close()
+        return
+    
+    db.insert_businesses_batch([
+        make_business(1, business_name="Bright Tech Solutions"),
+        make_business(2, business_name="Agra Sweets", category="Restaurants"),
+        make_business(3, business_name="Technova Labs", address="12 Fatehabad Road"),
+        make_business(4, business_name="City Clinic", category="Healthcare"),
+    ])
+    
+    for term in ["Tech", "sweets", "Fatehabad", "Restaurants", "Nothing Here"]:
+        fts_ids = sorted(row['id'] for row in db.search_businesses(term))
+        db.fts_enabled = False
+        like_ids = sorted(row['id'] for row in db.search_businesses(term))
+        db.fts_enabled = True
+        assert fts_ids == like_ids, f"'{term}': FTS {fts_ids} != LIKE {like_ids}"
+        print(f"✅ '{term}' → {len(fts_ids)} results either way")
+    db.close()
+
+def test_fts_word_prefix_semantics(db_path):
+    """FTS search matches word prefixes with every word required, and a blank term matches all."""
+    print("🧪 Testing FTS word-prefix matching...")
+    db = DatabaseManager(db_path)
+    if not db.fts_enabled:
+        print("⚠️ FTS5 unavailable in this SQLite build, skipping")
+        db.close()
+        return
+    
+    db.insert_businesses_batch([
+        make_business(1, business_name="Technova Labs", category="IT Services"),
+        make_business(2, business_name="Agra Sweets", category="Restaurants"),
+    ])
+    
+    def names(term):
+        return sorted(row['business_name'] for row in db.search_businesses(term))
+    
+    assert names("tech") == ["Technova Labs"]
+    assert names("nova") == [], "mid-word substrings no longer match"
+    assert names("technova restaurants") == [], "every word must match"
+    assert names("agra rest") == ["Agra Sweets"], "words may match different columns"
+    assert names('sweets"') == ["Agra Sweets"], "quotes are not FTS syntax"
+    assert names("   ") == ["Agra Sweets", "Technova Labs"]
+    assert len(db.get_businesses(search_term="   ")) == 2
+    print("✅ Prefix, all-words and blank-term behaviour pinned")
+    db.close()
+
+def test_cache_expiry(db_path):
+    """Cached coordinates and API responses are only returned while fresh."""
+    print("🧪 Testing cache TTL expiry...")
+    db = DatabaseManager(db_path)
+    
+    db.cache_coordinates("1 main road agra", 27.18, 78.01)
+    assert db.get_cached_coordinates("1 main road agra") == {'latitude': 27.18, 'longitude': 78.01}
+    with db._connect() as conn:
+        conn.execute("UPDATE geocode_cache SET fetched_at = datetime('now', '-3 days')")
+    assert db.get_cached_coordinates("1 main road agra", max_age_days=7) is not None
+    assert db.get_cached_coordinates("1 main road agra", max_age_days=2) is None
+    print("✅ Geocode cache expires after max_age_days")
+    
+    db.cache_response("places:agra", b'{"results": []}')
+    assert db.get_cached_response("places:agra", max_age_seconds=60) == b'{"results": []}'
+    with db._connect() as conn:
+        conn.execute("UPDATE api_cache SET fetched_at = fetched_at - 120")
+    assert db.get_cached_response("places:agra", max_age_seconds=300) is not None
+    assert db.get_cached_response("places:agra", max_age_seconds=60) is None
+    print("✅ API cache expires after max_age_seconds")
+    db.close()
+
+def test_fill_missing_fields(db_path):
+    """Merged fields reach stored rows without overwriting values already there."""
+    print("🧪 Testing fill_missing_fields on stored businesses...")
+    db = DatabaseManager(db_path)
+    
+    db.insert_businesses_batch([
+        make_business(1, website=''),
+        make_business(2, website='https://two.example', latitude=27.1, longitude=78.0),
+    ])
+    updated = db.fill_missing_fields([
+        make_business(1, website='https://one.example', latitude=27.2, longitude=78.1),
+        make_business(2, website='https://other.example', latitude=1.0, longitude=1.0),
+    ])
+    assert updated == 2, f"expected 2 rows matched, got {updated}"
+    
+    rows = {row['business_name']: row for row in db.get_businesses()}
+    assert rows['Business 1']['website'] == 'https://one.example'
+    assert rows['Business 1']['latitude'] == 27.2
+    assert rows['Business 2']['website'] == 'https://two.example'
+    assert rows['Business 2']['latitude'] == 27.1
+    print("✅ Empty fields filled, existing values kept")
+    db.close()
+
+def run_all():
+    """Run every test against its own temporary database."""
+    tests = [
+        test_batch_insert_across_chunks,
+        test_insert_after_clear_from_second_manager,
+        test_search_fts_matches_like,
+        test_fts_word_prefix_semantics,
+        test_cache_expiry,
+        test_fill_missing_fields,
+    ]
+    failed = 0
+    for test in tests:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            try:
+                test(os.path.join(tmpdir, "businesses.db"))
+            except AssertionError as e:
+                failed += 1
+                print(f"❌ {test.__name__} failed: {e}")
+    return failed == 0
+
+if __name__ == "__main__":
+    if run_all():
+        print("\n🎉 All DatabaseManager tests passed!")
+    else:
+        print("\n💥 Some DatabaseManager tests failed")
+        sys.exit(1)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test script to verify AsyncTokenBucket allows its burst and then paces to its rate.
+"""
+
+import asyncio
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.rate_limit import AsyncTokenBucket
+
+async def test_token_bucket_pacing():
+    """A full bucket serves its burst at once, later acquires wait for the refill."""
+    print("🧪 Testing AsyncTokenBucket pacing...")
+    bucket = AsyncTokenBucket(capacity=2, rate=20)
+    
+    start = time.monotonic()
+    await bucket.acquire()
+    await bucket.acquire()
+    burst = time.monotonic() - start
+    assert burst < 0.03, f"burst of 2 took {burst:.3f}s"
+    print(f"✅ Burst of 2 served in {burst:.3f}s")
+    
+    # Six more tokens at 20/s need about 0.3s, even when taken concurrently
+    start = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+    paced = time.monotonic() - start
+    assert 0.27 <= paced < 0.6, f"6 paced acquires took {paced:.3f}s"
+    print(f"✅ 6 further acquires paced over {paced:.3f}s")
+    
+    # The context manager takes a token too
+    start = time.monotonic()
+    async with bucket:
+        pass
+    assert time.monotonic() - start >= 0.04
+    print("✅ async with waits for a token")
+    return True
+
+if __name__ == "__main__":
+    try:
+        result = asyncio.run(test_token_bucket_pacing())
+    except AssertionError as e:
+        print(f"❌ {e}")
+        result = False
+    if result:
+        print("\n🎉 Rate limit test passed!")
+    else:
+        print("\n💥 Rate limit test failed")
+        sys.exit(1)
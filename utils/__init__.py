@@ -1,4 +1,5 @@
 # Utils module
 from .scraping_utils import ScrapingUtils
+from .rate_limit import AsyncTokenBucket
 
-__all__ = ['ScrapingUtils']
+__all__ = ['ScrapingUtils', 'AsyncTokenBucket']
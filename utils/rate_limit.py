@@ -0,0 +1,35 @@
+import time
+import asyncio
+
+
+class AsyncTokenBucket:
+    """Async token-bucket limiter: steady refill rate with a bounded burst."""
+
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate  # tokens per second
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+
+    def _refill(self):
+        """Top the bucket up for the time elapsed since the last refill."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                # No await between the check and the decrement, so this is safe across tasks
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
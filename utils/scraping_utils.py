@@ -1,18 +1,36 @@
 import time
+import threading
 import random
 import logging
 import asyncio
+from collections import OrderedDict
 from fake_useragent import UserAgent
 from urllib.parse import urljoin, urlparse
 import requests
 from typing import Optional, Dict, Any
 
+from config import find_phones, find_emails, find_websites, clean_phone
+
 class ScrapingUtils:
     """Utility functions for web scraping operations."""
     
-    def __init__(self):
+    # Nominatim's usage policy allows at most one request per second per client
+    geocode_min_interval = 1.0
+    
+    # Addresses kept in the in-process geocode memo; older ones fall back to the store
+    geocode_memo_size = 1024
+    
+    def __init__(self, geocode_store=None):
         self.ua = UserAgent()
         self.session = requests.Session()
+        # Geocoding results: an in-process memo in front of an optional persistent
+        # store (anything with get_cached_coordinates/cache_coordinates, e.g. DatabaseManager)
+        self.geocode_store = geocode_store
+        self._geocode_memo = OrderedDict()
+        self._memo_lock = threading.Lock()
+        # Geocoding runs on executor threads, so the request pacing is guarded by a lock
+        self._geocode_lock = threading.Lock()
+        self._next_geocode_at = 0.0
         self.setup_session()
     
     def setup_session(self):
@@ -102,53 +120,28 @@ class ScrapingUtils:
     
     def extract_phone_numbers(self, text: str) -> list:
         """Extract phone numbers from text using regex."""
-        import re
+        phone_numbers = find_phones(text)
         
-        # Indian phone number patterns
-        patterns = [
-            r'\+91[\s-]?[789]\d{9}',  # +91 with 10 digits
-            r'91[\s-]?[789]\d{9}',    # 91 with 10 digits
-            r'[789]\d{9}',            # 10 digit mobile
-            r'\d{3}[\s-]?\d{3}[\s-]?\d{4}',  # Generic pattern
-            r'\(\d{3}\)[\s-]?\d{3}[\s-]?\d{4}',  # (XXX) XXX-XXXX
-        ]
-        
-        phone_numbers = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            phone_numbers.extend(matches)
-        
-        # Clean and deduplicate
+        # Clean and deduplicate, keeping first-seen order
         cleaned_numbers = []
+        seen = set()
         for number in phone_numbers:
-            cleaned = re.sub(r'[^\d+]', '', number)
-            if len(cleaned) >= 10 and cleaned not in cleaned_numbers:
+            cleaned = clean_phone(number)
+            if len(cleaned) >= 10 and cleaned not in seen:
+                seen.add(cleaned)
                 cleaned_numbers.append(cleaned)
         
         return cleaned_numbers
     
     def extract_emails(self, text: str) -> list:
         """Extract email addresses from text."""
-        import re
-        
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
+        emails = find_emails(text)
         
         return list(set(emails))  # Remove duplicates
     
     def extract_websites(self, text: str) -> list:
         """Extract website URLs from text."""
-        import re
-        
-        url_patterns = [
-            r'https?://[^\s<>"{}|\\^`\[\]]+',
-            r'www\.[^\s<>"{}|\\^`\[\]]+',
-        ]
-        
-        urls = []
-        for pattern in url_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            urls.extend(matches)
+        urls = find_websites(text)
         
         # Clean URLs
         cleaned_urls = []
@@ -178,8 +171,48 @@ class ScrapingUtils:
         
         return text
     
+    @staticmethod
+    def _address_key(address: str) -> str:
+        """Normalize an address for cache lookups (casefolded, whitespace collapsed)."""
+        return ' '.join(address.casefold().split())
+    
+    def _memo_get(self, address_key: str) -> Optional[Dict[str, float]]:
+        """Return memoized coordinates, marking them as recently used."""
+        with self._memo_lock:
+            coords = self._geocode_memo.get(address_key)
+            if coords is not None:
+                self._geocode_memo.move_to_end(address_key)
+            return coords
+    
+    def _memo_put(self, address_key: str, coords: Dict[str, float]):
+        """Memoize coordinates, evicting the least recently used beyond geocode_memo_size."""
+        with self._memo_lock:
+            self._geocode_memo[address_key] = coords
+            self._geocode_memo.move_to_end(address_key)
+            if len(self._geocode_memo) > self.geocode_memo_size:
+                self._geocode_memo.popitem(last=False)
+    
+    def _wait_for_geocode_slot(self):
+        """Block until the next Nominatim request may be sent, then reserve the slot."""
+        with self._geocode_lock:
+            now = time.monotonic()
+            start = max(now, self._next_geocode_at)
+            self._next_geocode_at = start + self.geocode_min_interval
+        if start > now:
+            time.sleep(start - now)
+    
     def geocode_address(self, address: str) -> Optional[Dict[str, float]]:
         """Get latitude and longitude for an address using a free geocoding service."""
+        # Only real lookups are cached; city-level fallbacks are retried next time
+        address_key = self._address_key(address)
+        coords = self._memo_get(address_key)
+        if coords is None and self.geocode_store is not None:
+            coords = self.geocode_store.get_cached_coordinates(address_key)
+            if coords:
+                self._memo_put(address_key, coords)
+        if coords:
+            return coords
+        
         try:
             # Using Nominatim (OpenStreetMap) - free geocoding service
             base_url = "https://nominatim.openstreetmap.org/search"
@@ -196,16 +229,23 @@ class ScrapingUtils:
             # Increase timeout and add retry logic
             for attempt in range(2):
                 try:
+                    self._wait_for_geocode_slot()
                     response = requests.get(base_url, params=params, headers=headers, timeout=10)
                     
                     if response.status_code == 200:
                         data = response.json()
                         if data:
                             location = data[0]
-                            return {
+                            coords = {
                                 'latitude': float(location['lat']),
                                 'longitude': float(location['lon'])
                             }
+                            self._memo_put(address_key, coords)
+                            if self.geocode_store is not None:
+                                self.geocode_store.cache_coordinates(
+                                    address_key, coords['latitude'], coords['longitude']
+                                )
+                            return coords
                     break  # Exit retry loop if successful
                     
                 except requests.exceptions.Timeout: